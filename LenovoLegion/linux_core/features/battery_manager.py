@@ -16,6 +16,12 @@ from datetime import datetime, timedelta
 import logging
 import json
 
+try:
+    import pyudev
+    HAS_PYUDEV = True
+except ImportError:
+    HAS_PYUDEV = False
+
 @dataclass
 class BatteryInfo:
     """Battery information structure"""
@@ -47,6 +53,21 @@ class BatterySettings:
 class BatteryManager:
     """Advanced battery management system"""
 
+    # sysfs file name -> BatteryInfo field
+    BATTERY_INT_FILES = (
+        ('capacity', 'capacity'),
+        ('energy_full_design', 'design_capacity'),
+        ('energy_full', 'full_charge_capacity'),
+        ('current_now', 'current_now'),
+        ('voltage_now', 'voltage_now'),
+        ('cycle_count', 'cycle_count')
+    )
+    BATTERY_STR_FILES = (
+        ('status', 'status'),
+        ('health', 'health')
+    )
+    SYSFS_FIELD_SIZE = 64  # bytes reserved per numeric field in the read buffer
+
     def __init__(self):
         self.logger = logging.getLogger("legion.battery")
         self.settings = BatterySettings()
@@ -61,11 +82,28 @@ class BatteryManager:
         self.monitoring_active = False
         self.monitoring_task = None
         self.last_battery_info = None
+        self.poll_interval = 30  # seconds, used when pyudev is unavailable
+        self.health_check_interval = 300  # seconds, used with udev events
+        self._last_ac_state: Optional[bool] = None
+
+        # power_supply udev events, registered as an event loop reader
+        self._power_supply_monitor = None
+        self._power_supply_task = None
+        self._power_supply_pending = False
+
+        # Reused across get_battery_info calls to avoid per-read allocations
+        self._read_buf = bytearray(self.SYSFS_FIELD_SIZE * len(self.BATTERY_INT_FILES))
+        self._read_view = memoryview(self._read_buf)
 
         # Conservation mode state
         self.conservation_active = False
         self.original_charge_threshold = None
 
+        # GPU switching state, probed once by _detect_gpu_mechanism
+        self._gpu_mechanism: Optional[str] = None  # 'prime', 'vgaswitcheroo' or None
+        self._gpu_mechanism_probed = False
+        self._current_gpu_mode: Optional[str] = None  # 'integrated', 'discrete' or None
+
     async def initialize(self) -> bool:
         """Initialize battery management system"""
         try:
@@ -77,6 +115,9 @@ class BatteryManager:
             # Load saved settings
             await self.load_settings()
 
+            # Probe GPU switching support before applying hybrid mode
+            await self._detect_gpu_mechanism()
+
             # Apply initial settings
             await self.apply_settings()
 
@@ -93,12 +134,8 @@ class BatteryManager:
     async def is_battery_present(self) -> bool:
         """Check if battery is present"""
         try:
-            if self.battery_path.exists():
-                present_file = self.battery_path / "present"
-                if present_file.exists():
-                    with open(present_file, 'r') as f:
-                        return f.read().strip() == "1"
-            return False
+            with open(self.battery_path / "present", 'rb') as f:
+                return f.read().strip() == b"1"
         except Exception:
             return False
 
@@ -110,30 +147,27 @@ class BatteryManager:
 
             info_dict = {}
 
-            # Read all battery properties
-            battery_files = {
-                'capacity': 'capacity',
-                'energy_full_design': 'design_capacity',
-                'energy_full': 'full_charge_capacity',
-                'current_now': 'current_now',
-                'voltage_now': 'voltage_now',
-                'status': 'status',
-                'health': 'health',
-                'cycle_count': 'cycle_count'
-            }
-
-            for file_name, prop_name in battery_files.items():
-                file_path = self.battery_path / file_name
-                if file_path.exists():
-                    try:
-                        with open(file_path, 'r') as f:
-                            value = f.read().strip()
-                            if prop_name in ['status', 'health']:
-                                info_dict[prop_name] = value
-                            else:
-                                info_dict[prop_name] = int(value)
-                    except (ValueError, IOError):
-                        info_dict[prop_name] = 0 if prop_name not in ['status', 'health'] else 'Unknown'
+            # Read numeric properties as raw bytes and parse them in one pass
+            raw_ints = []
+            for index, (file_name, prop_name) in enumerate(self.BATTERY_INT_FILES):
+                offset = index * self.SYSFS_FIELD_SIZE
+                try:
+                    length = self._read_into_buffer(self.battery_path / file_name, offset)
+                    raw_ints.append((prop_name, self._read_buf[offset:offset + length]))
+                except FileNotFoundError:
+                    pass
+                except IOError:
+                    info_dict[prop_name] = 0
+            info_dict.update(self._parse_int_fields(raw_ints))
+
+            for file_name, prop_name in self.BATTERY_STR_FILES:
+                try:
+                    with open(self.battery_path / file_name, 'rb') as f:
+                        info_dict[prop_name] = f.read().decode('ascii', 'replace').strip()
+                except FileNotFoundError:
+                    pass
+                except IOError:
+                    info_dict[prop_name] = 'Unknown'
 
             # Calculate temperature from thermal zone
             temp = await self._get_battery_temperature()
@@ -163,32 +197,61 @@ class BatteryManager:
             self.logger.error(f"Failed to get battery info: {e}")
             return None
 
+    def _read_into_buffer(self, path: Path, offset: int) -> int:
+        """Read a sysfs file into the shared buffer slot at offset"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.readv(fd, [self._read_view[offset:offset + self.SYSFS_FIELD_SIZE]])
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _parse_int_fields(raw_fields: List[tuple]) -> Dict[str, int]:
+        """Parse (name, bytes-like) pairs into ints, malformed values become 0"""
+        names = [name for name, _ in raw_fields]
+        try:
+            # int() accepts bytes/bytearray with surrounding whitespace, so a single
+            # C-level map() covers every field without decode/strip copies
+            return dict(zip(names, map(int, [raw for _, raw in raw_fields])))
+        except ValueError:
+            parsed = {}
+            for name, raw in raw_fields:
+                try:
+                    parsed[name] = int(raw)
+                except ValueError:
+                    parsed[name] = 0
+            return parsed
+
     async def _get_battery_temperature(self) -> float:
         """Get battery temperature from thermal zone"""
         try:
             # Try thermal zone first
             for i in range(10):
-                thermal_path = Path(f"/sys/class/thermal/thermal_zone{i}")
-                if thermal_path.exists():
-                    type_file = thermal_path / "type"
-                    if type_file.exists():
-                        with open(type_file, 'r') as f:
-                            zone_type = f.read().strip()
-                            if 'battery' in zone_type.lower() or 'bat' in zone_type.lower():
-                                temp_file = thermal_path / "temp"
-                                if temp_file.exists():
-                                    with open(temp_file, 'r') as f:
-                                        return int(f.read().strip()) / 1000.0
+                thermal_path = f"/sys/class/thermal/thermal_zone{i}"
+                try:
+                    with open(f"{thermal_path}/type", 'r') as f:
+                        zone_type = f.read().strip()
+                except FileNotFoundError:
+                    continue
+
+                if 'battery' in zone_type.lower() or 'bat' in zone_type.lower():
+                    try:
+                        with open(f"{thermal_path}/temp", 'r') as f:
+                            return int(f.read().strip()) / 1000.0
+                    except FileNotFoundError:
+                        pass
 
             # Fallback to ACPI if available
-            acpi_temp_path = Path("/proc/acpi/battery/BAT0/temperature")
-            if acpi_temp_path.exists():
-                with open(acpi_temp_path, 'r') as f:
+            try:
+                with open("/proc/acpi/battery/BAT0/temperature", 'r') as f:
                     content = f.read()
-                    for line in content.split('\n'):
-                        if 'temperature' in line.lower():
-                            temp_str = line.split(':')[1].strip().split()[0]
-                            return float(temp_str)
+            except FileNotFoundError:
+                return 25.0
+
+            for line in content.split('\n'):
+                if 'temperature' in line.lower():
+                    temp_str = line.split(':')[1].strip().split()[0]
+                    return float(temp_str)
 
             return 25.0  # Default room temperature
 
@@ -232,19 +295,17 @@ class BatteryManager:
     async def is_ac_connected(self) -> bool:
         """Check if AC adapter is connected"""
         try:
-            # Try ADP1 first (most common)
-            online_file = self.ac_path / "online"
-            if online_file.exists():
-                with open(online_file, 'r') as f:
-                    return f.read().strip() == "1"
-
-            # Try other AC adapter names
-            for ac_name in ["AC", "ADP0", "ACAD"]:
-                ac_path = Path(f"/sys/class/power_supply/{ac_name}")
-                online_file = ac_path / "online"
-                if online_file.exists():
-                    with open(online_file, 'r') as f:
-                        return f.read().strip() == "1"
+            # Try ADP1 first (most common), then other AC adapter names
+            online_files = [self.ac_path / "online"] + [
+                f"/sys/class/power_supply/{ac_name}/online"
+                for ac_name in ["AC", "ADP0", "ACAD"]
+            ]
+            for online_file in online_files:
+                try:
+                    with open(online_file, 'rb') as f:
+                        return f.read().strip() == b"1"
+                except FileNotFoundError:
+                    continue
 
             return False
 
@@ -390,12 +451,8 @@ class BatteryManager:
     async def _get_charge_threshold_standard(self) -> Optional[int]:
         """Get charge threshold using standard Linux interface"""
         try:
-            threshold_path = Path("/sys/class/power_supply/BAT0/charge_control_end_threshold")
-            if threshold_path.exists():
-                with open(threshold_path, 'r') as f:
-                    return int(f.read().strip())
-
-            return None
+            with open("/sys/class/power_supply/BAT0/charge_control_end_threshold", 'rb') as f:
+                return int(f.read())
 
         except Exception:
             return None
@@ -498,27 +555,56 @@ class BatteryManager:
             self.logger.error(f"Failed to set hybrid mode: {e}")
             return False
 
+    async def _detect_gpu_mechanism(self):
+        """Detect the GPU switching mechanism and current mode once"""
+        self._gpu_mechanism_probed = True
+
+        # NVIDIA Prime
+        if Path("/usr/bin/prime-select").exists():
+            self._gpu_mechanism = "prime"
+            try:
+                result = subprocess.run(['prime-select', 'query'],
+                                      capture_output=True, text=True, timeout=2)
+                self._current_gpu_mode = {
+                    "intel": "integrated",
+                    "nvidia": "discrete"
+                }.get(result.stdout.strip())
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+                self._current_gpu_mode = None
+
+        # AMD/Intel switching
+        elif Path("/sys/kernel/debug/vgaswitcheroo/switch").exists():
+            self._gpu_mechanism = "vgaswitcheroo"
+
+        else:
+            self._gpu_mechanism = None
+            self.logger.debug("No GPU switching mechanism available")
+
     async def _set_gpu_mode(self, mode: str):
         """Set GPU mode (integrated/discrete)"""
         try:
-            # Try various GPU switching mechanisms
+            if not self._gpu_mechanism_probed:
+                await self._detect_gpu_mechanism()
 
-            # NVIDIA Prime
-            if Path("/usr/bin/prime-select").exists():
+            # Nothing to switch, or already in the requested mode
+            if self._gpu_mechanism is None or mode == self._current_gpu_mode:
+                return
+
+            if self._gpu_mechanism == "prime":
                 if mode == "integrated":
-                    subprocess.run(['sudo', 'prime-select', 'intel'], timeout=30)
+                    subprocess.run(['sudo', 'prime-select', 'intel'], check=True, timeout=30)
                 else:
-                    subprocess.run(['sudo', 'prime-select', 'nvidia'], timeout=30)
-                return
+                    subprocess.run(['sudo', 'prime-select', 'nvidia'], check=True, timeout=30)
 
-            # AMD/Intel switching
-            if Path("/sys/kernel/debug/vgaswitcheroo/switch").exists():
+            elif self._gpu_mechanism == "vgaswitcheroo":
                 if mode == "integrated":
                     subprocess.run(['sudo', 'sh', '-c', 'echo IGD > /sys/kernel/debug/vgaswitcheroo/switch'],
-                                  timeout=10)
+                                  check=True, timeout=10)
                 else:
                     subprocess.run(['sudo', 'sh', '-c', 'echo DIS > /sys/kernel/debug/vgaswitcheroo/switch'],
-                                  timeout=10)
+                                  check=True, timeout=10)
+
+            self._current_gpu_mode = mode
 
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
             pass
@@ -541,9 +627,6 @@ class BatteryManager:
                 # Battery optimizations
                 await self._write_kernel_param("cpu_pl2", "90")  # Reduce turbo power
                 await self._write_kernel_param("gpu_tgp", "80")  # Reduce GPU power
-
-                if self.settings.hybrid_mode:
-                    await self._set_gpu_mode("integrated")
             else:
                 # AC optimizations
                 await self._write_kernel_param("cpu_pl2", "140")  # Full turbo power
@@ -566,6 +649,7 @@ class BatteryManager:
     async def stop_monitoring(self):
         """Stop battery monitoring"""
         self.monitoring_active = False
+        self._stop_power_supply_monitor()
         if self.monitoring_task:
             self.monitoring_task.cancel()
             try:
@@ -575,27 +659,114 @@ class BatteryManager:
         self.logger.info("Battery monitoring stopped")
 
     async def _monitoring_loop(self):
-        """Battery monitoring loop"""
+        """Battery monitoring loop
+
+        With pyudev the power profile is reapplied on power_supply uevents
+        only, and health checks run on a slow timer. Without it, fall back
+        to polling.
+        """
+        if not HAS_PYUDEV:
+            await self._polling_loop()
+            return
+
+        try:
+            context = pyudev.Context()
+            monitor = pyudev.Monitor.from_netlink(context)
+            monitor.filter_by(subsystem='power_supply')
+            monitor.start()
+
+            asyncio.get_running_loop().add_reader(monitor.fileno(), self._on_power_supply_event)
+            self._power_supply_monitor = monitor
+        except Exception as e:
+            self.logger.warning(f"udev monitor unavailable, falling back to polling: {e}")
+            await self._polling_loop()
+            return
+
+        try:
+            await self._handle_power_supply_change()
+            await self._health_check_loop()
+        finally:
+            self._stop_power_supply_monitor()
+
+    async def _polling_loop(self):
+        """Fallback monitoring loop for systems without pyudev"""
         while self.monitoring_active:
             try:
-                # Check AC status and apply appropriate profile
-                await self.apply_power_profile("auto")
+                await self._handle_power_supply_change()
+                await self._check_battery_health()
+
+                await asyncio.sleep(self.poll_interval)
+
+            except Exception as e:
+                self.logger.error(f"Battery monitoring error: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    def _stop_power_supply_monitor(self):
+        """Unsubscribe from power_supply udev events"""
+        if self._power_supply_task is not None:
+            self._power_supply_task.cancel()
+            self._power_supply_task = None
+
+        if self._power_supply_monitor is None:
+            return
+
+        try:
+            asyncio.get_running_loop().remove_reader(self._power_supply_monitor.fileno())
+        except Exception:
+            pass
+        self._power_supply_monitor = None
+
+    def _on_power_supply_event(self):
+        """Drain pending power_supply events and schedule a single profile update"""
+        while self._power_supply_monitor.poll(timeout=0) is not None:
+            pass
+
+        self._power_supply_pending = True
+        if self._power_supply_task is None or self._power_supply_task.done():
+            self._power_supply_task = asyncio.ensure_future(self._process_power_supply_events())
+
+    async def _process_power_supply_events(self):
+        """Reapply the power profile on AC/battery transitions"""
+        # Events that arrive while a change is being applied get one more pass
+        while self._power_supply_pending:
+            self._power_supply_pending = False
+            try:
+                await self._handle_power_supply_change()
+            except Exception as e:
+                self.logger.error(f"Power supply event error: {e}")
 
-                # Get battery info for health monitoring
-                battery_info = await self.get_battery_info()
-                if battery_info:
-                    # Check for concerning conditions
-                    if battery_info.temperature > 45:
-                        self.logger.warning(f"High battery temperature: {battery_info.temperature:.1f}°C")
+    async def _handle_power_supply_change(self):
+        """Apply the auto power profile if the AC state changed"""
+        is_ac = await self.is_ac_connected()
+        if is_ac == self._last_ac_state:
+            return
 
-                    if battery_info.health == "Degraded":
-                        self.logger.warning("Battery health degraded - consider replacement")
+        self._last_ac_state = is_ac
+        await self.apply_power_profile("auto")
 
-                await asyncio.sleep(30)  # Check every 30 seconds
+        # GPU switching is slow, so only do it on an actual AC -> battery transition
+        if not is_ac and self.settings.hybrid_mode:
+            await self._set_gpu_mode("integrated")
 
+    async def _health_check_loop(self):
+        """Coarse timer for battery temperature and health warnings"""
+        while self.monitoring_active:
+            try:
+                await self._check_battery_health()
             except Exception as e:
-                self.logger.error(f"Battery monitoring error: {e}")
-                await asyncio.sleep(30)
+                self.logger.error(f"Battery health check error: {e}")
+
+            await asyncio.sleep(self.health_check_interval)
+
+    async def _check_battery_health(self):
+        """Log warnings for concerning battery conditions"""
+        battery_info = await self.get_battery_info()
+        if battery_info:
+            if battery_info.temperature > 45:
+                self.logger.warning(f"High battery temperature: {battery_info.temperature:.1f}°C")
+
+            if battery_info.health == "Degraded":
+                self.logger.warning("Battery health degraded - consider replacement")
 
     async def _write_kernel_param(self, param: str, value: str) -> bool:
         """Write parameter to kernel module"""
@@ -610,10 +781,8 @@ class BatteryManager:
     async def _read_kernel_param(self, param: str) -> Optional[str]:
         """Read parameter from kernel module"""
         try:
-            path = Path(f"{self.kernel_module_path}/{param}")
-            if path.exists():
-                with open(path, 'r') as f:
-                    return f.read().strip()
+            with open(f"{self.kernel_module_path}/{param}", 'r') as f:
+                return f.read().strip()
         except Exception:
             pass
         return None
@@ -6,20 +6,120 @@ Provides feature parity with Windows display management features
 """
 
 import os
-import sys
 import subprocess
 import asyncio
 from pathlib import Path
 from typing import Dict, Optional, List, Any, Tuple
 from dataclasses import dataclass
-from datetime import datetime
 import logging
-import json
 import re
 
+# json and datetime are imported where used: json is only needed when
+# orjson is unavailable and datetime only for auto-brightness. re and
+# subprocess stay here since asyncio/logging import them anyway.
+
+try:
+    import pyudev
+    HAS_PYUDEV = True
+except ImportError:
+    HAS_PYUDEV = False
+
+try:
+    import xcffib
+    import xcffib.randr
+    HAS_XCFFIB = True
+except ImportError:
+    HAS_XCFFIB = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Precompiled patterns for the xrandr/wlr-randr/DRM parsers
+_RE_HEADER = re.compile(r'^(\S+)\s+(connected|disconnected)(\s+primary)?')
+_RE_RES = re.compile(r'(\d+)x(\d+)\+\d+\+\d+')
+_RE_ACTIVE_RATE = re.compile(r'(\d+(?:\.\d+)?)\*')
+_RE_BRIGHT = re.compile(r'Brightness: ([\d.]+)')
+_RE_WL_MODE = re.compile(r'(\d+) x (\d+) @ ([\d.]+) Hz')
+_RE_DRM_MODE = re.compile(r'(\d+)x(\d+)')
+
+_VRR_PROPS = frozenset({'vrr', 'freesync', 'g-sync', 'adaptive sync'})
+
+def _dumps(obj) -> bytes:
+    """Serialize settings to indented JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    import json
+    return json.dumps(obj, indent=2).encode()
+
+def _loads(data: bytes):
+    """Deserialize JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+def _read_small(path, size: int = 64) -> str:
+    """Read a small sysfs file without the buffered text I/O stack"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size).decode()
+    finally:
+        os.close(fd)
+
+def _write_sysfs(path, value) -> bool:
+    """Write a small sysfs value, falling back to sudo if not writable
+
+    Direct writes work once the udev rules grant the video/legion group
+    write access; the sudo pipeline remains as a fallback.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY)
+        try:
+            os.write(fd, str(value).encode())
+        finally:
+            os.close(fd)
+        return True
+    except PermissionError:
+        subprocess.run(['sudo', 'sh', '-c', f'echo {value} > {path}'],
+                      check=True, timeout=5)
+        return True
+
+def _edid_has_hdr_metadata(edid: bytes) -> bool:
+    """Check an EDID for a CTA-861 HDR Static Metadata Data Block"""
+    for offset in range(128, len(edid) - 127, 128):
+        # CTA-861 extension block
+        if edid[offset] != 0x02:
+            continue
+
+        # Data block collection runs from byte 4 to the DTD offset
+        end = offset + edid[offset + 2]
+        pos = offset + 4
+        while pos < end:
+            tag = edid[pos] >> 5
+            length = edid[pos] & 0x1f
+
+            # Extended tag block (7) with extended tag 0x06 = HDR static metadata
+            if tag == 7 and length >= 1 and edid[pos + 1] == 0x06:
+                return True
+
+            pos += 1 + length
+
+    return False
+
 @dataclass
 class DisplayInfo:
     """Display information structure"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        'name', 'connector', 'width', 'height', 'refresh_rate', 'connected',
+        'primary', 'brightness', 'hdr_supported', 'hdr_enabled',
+        'gsync_supported', 'gsync_enabled', 'overdrive_supported',
+        'overdrive_level', 'color_depth', 'color_space'
+    )
+
     name: str
     connector: str  # eDP-1, HDMI-A-1, etc.
     width: int
@@ -64,6 +164,26 @@ class DisplayManager:
         self.monitoring_active = False
         self.monitoring_task = None
         self.current_displays = {}
+        self._session_type = ('wayland' if os.environ.get('WAYLAND_DISPLAY')
+                              else 'x11' if os.environ.get('DISPLAY') else 'drm')
+        self._displays_dirty = True  # current_displays needs a re-scan
+
+        # DRM hotplug events (pyudev), replaces periodic re-detection
+        self._drm_monitor = None
+        self._drm_refresh_task = None
+        self._drm_event_count = 0  # bumped per event batch, detects events during a refresh
+
+        # Adaptive monitoring interval, doubles while the topology is stable
+        self.min_monitor_interval = 30  # seconds
+        self.max_monitor_interval = 300  # seconds
+        self._monitor_interval = self.min_monitor_interval
+        self._last_topology: Optional[tuple] = None
+
+        # Cached XCB connection for RandR queries
+        self._xcb_conn = None
+
+        # Cached DRM connector directories, see _get_drm_paths
+        self._drm_paths: Optional[Dict[str, Path]] = None
 
         # Brightness control paths
         self.brightness_paths = [
@@ -73,6 +193,16 @@ class DisplayManager:
             "/sys/class/backlight/amdgpu_bl0"
         ]
 
+        # Brightness write coalescing
+        self.brightness_debounce = 0.02  # seconds
+        self._pending_brightness: Optional[int] = None
+        self._brightness_task = None
+        self._last_auto_bucket: Optional[str] = None
+
+        # Settings save coalescing
+        self.save_delay = 0.25  # seconds
+        self._save_task = None
+
     async def initialize(self) -> bool:
         """Initialize display management system"""
         try:
@@ -95,17 +225,26 @@ class DisplayManager:
             self.logger.error(f"Display initialization failed: {e}")
             return False
 
-    async def detect_displays(self) -> List[DisplayInfo]:
-        """Detect all connected displays"""
+    async def detect_displays(self, force: bool = False) -> List[DisplayInfo]:
+        """Detect all connected displays
+
+        Returns the cached topology unless a hotplug event invalidated it
+        or force is set.
+        """
+        if not force and not self._displays_dirty:
+            return list(self.current_displays.values())
+
+        # Cleared before scanning so a hotplug during the scan marks it dirty again
+        self._displays_dirty = False
         try:
             displays = []
 
-            # Try xrandr first (X11)
-            displays.extend(await self._detect_displays_xrandr())
-
-            # Try wlr-randr for Wayland
-            if not displays:
+            # Query only the tool matching the session; xrandr can hang
+            # under Wayland, so never run both
+            if self._session_type == 'wayland':
                 displays.extend(await self._detect_displays_wayland())
+            elif self._session_type == 'x11':
+                displays.extend(await self._detect_displays_xrandr())
 
             # Try DRM interface directly
             if not displays:
@@ -119,96 +258,173 @@ class DisplayManager:
 
         except Exception as e:
             self.logger.error(f"Display detection failed: {e}")
+            self._displays_dirty = True
             return []
 
     async def _detect_displays_xrandr(self) -> List[DisplayInfo]:
         """Detect displays using xrandr (X11)"""
         try:
-            result = subprocess.run(['xrandr', '--verbose'],
-                                  capture_output=True, text=True, timeout=10)
+            # Query RandR directly over XCB, fall back to the xrandr binary
+            displays = self._query_xcb_randr()
 
-            if result.returncode != 0:
-                return []
+            if displays is None:
+                returncode, output = await self._run_command('xrandr', '--verbose', timeout=10)
 
-            displays = []
-            current_display = None
+                if returncode != 0:
+                    return []
 
-            for line in result.stdout.split('\n'):
-                line = line.strip()
+                displays = self._parse_xrandr_verbose(output)
 
-                # Display connection line
-                if ' connected' in line or ' disconnected' in line:
-                    if current_display:
-                        displays.append(current_display)
+            # Check for HDR and other advanced features on all outputs at once
+            await asyncio.gather(*[self._check_advanced_features(display)
+                                   for display in displays if display.connected])
 
-                    parts = line.split()
-                    connector = parts[0]
-                    connected = 'connected' in line
-                    primary = 'primary' in line
+            return displays
 
-                    current_display = DisplayInfo(
-                        name=connector,
-                        connector=connector,
-                        width=0, height=0, refresh_rate=0.0,
-                        connected=connected, primary=primary,
-                        brightness=100, hdr_supported=False, hdr_enabled=False,
-                        gsync_supported=False, gsync_enabled=False,
-                        overdrive_supported=False, overdrive_level=0,
-                        color_depth=8, color_space="sRGB"
-                    )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return []
 
-                    # Parse resolution if connected
-                    if connected:
-                        resolution_match = re.search(r'(\d+)x(\d+)\+\d+\+\d+', line)
-                        if resolution_match:
-                            current_display.width = int(resolution_match.group(1))
-                            current_display.height = int(resolution_match.group(2))
+    async def _run_command(self, *args: str, timeout: float,
+                           check: bool = False) -> Tuple[int, str]:
+        """Run a command without blocking the event loop, returns (returncode, stdout)"""
+        proc = await asyncio.create_subprocess_exec(*args,
+                                                    stdout=asyncio.subprocess.PIPE,
+                                                    stderr=asyncio.subprocess.DEVNULL)
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(list(args), timeout)
 
-                # Brightness information
-                elif 'Brightness:' in line and current_display:
-                    brightness_match = re.search(r'Brightness: ([\d.]+)', line)
-                    if brightness_match:
-                        brightness = float(brightness_match.group(1))
-                        current_display.brightness = int(brightness * 100)
-
-                # Refresh rate information
-                elif '*' in line and '+' in line and current_display:
-                    # Current mode line
-                    parts = line.split()
-                    for part in parts:
-                        if '*' in part:
-                            try:
-                                current_display.refresh_rate = float(part.replace('*', '').replace('+', ''))
-                            except ValueError:
-                                pass
-
-            # Add last display
-            if current_display:
-                displays.append(current_display)
+        if check and proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, list(args))
+
+        return proc.returncode, stdout.decode(errors='replace')
+
+    def _query_xcb_randr(self) -> Optional[List[DisplayInfo]]:
+        """Query outputs through XCB RandR, returns None if unavailable"""
+        if not HAS_XCFFIB:
+            return None
+
+        try:
+            if self._xcb_conn is None:
+                self._xcb_conn = xcffib.connect()
+
+            conn = self._xcb_conn
+            randr = conn(xcffib.randr.key)
+            root = conn.get_setup().roots[conn.pref_screen].root
+
+            resources = randr.GetScreenResourcesCurrent(root).reply()
+            timestamp = resources.config_timestamp
+            primary_output = randr.GetOutputPrimary(root).reply().output
 
-            # Check for HDR and other advanced features
-            for display in displays:
-                if display.connected:
-                    await self._check_advanced_features(display)
+            # Refresh rate per mode id
+            mode_rates = {
+                mode.id: mode.dot_clock / (mode.htotal * mode.vtotal)
+                for mode in resources.modes if mode.htotal and mode.vtotal
+            }
+
+            displays = []
+            for output in resources.outputs:
+                info = randr.GetOutputInfo(output, timestamp).reply()
+                connector = bytes(info.name).decode('utf-8', 'replace')
+                connected = info.connection == xcffib.randr.Connection.Connected
+
+                display = DisplayInfo(
+                    name=connector,
+                    connector=connector,
+                    width=0, height=0, refresh_rate=0.0,
+                    connected=connected, primary=output == primary_output,
+                    brightness=100, hdr_supported=False, hdr_enabled=False,
+                    gsync_supported=False, gsync_enabled=False,
+                    overdrive_supported=False, overdrive_level=0,
+                    color_depth=8, color_space="sRGB"
+                )
+
+                if connected and info.crtc:
+                    crtc = randr.GetCrtcInfo(info.crtc, timestamp).reply()
+                    display.width = crtc.width
+                    display.height = crtc.height
+                    display.refresh_rate = round(mode_rates.get(crtc.mode, 0.0), 2)
+
+                displays.append(display)
 
             return displays
 
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return []
+        except Exception as e:
+            self.logger.debug(f"XCB RandR query failed, using xrandr: {e}")
+            self._xcb_conn = None
+            return None
+
+    def _parse_xrandr_verbose(self, output: str) -> List[DisplayInfo]:
+        """Parse `xrandr --verbose` output into DisplayInfo records"""
+        displays = []
+        current_display = None
+
+        for line in output.split('\n'):
+            line = line.strip()
+
+            # Display connection line
+            header_match = _RE_HEADER.match(line)
+            if header_match:
+                if current_display:
+                    displays.append(current_display)
+
+                connector = header_match.group(1)
+                connected = header_match.group(2) == 'connected'
+                primary = header_match.group(3) is not None
+
+                current_display = DisplayInfo(
+                    name=connector,
+                    connector=connector,
+                    width=0, height=0, refresh_rate=0.0,
+                    connected=connected, primary=primary,
+                    brightness=100, hdr_supported=False, hdr_enabled=False,
+                    gsync_supported=False, gsync_enabled=False,
+                    overdrive_supported=False, overdrive_level=0,
+                    color_depth=8, color_space="sRGB"
+                )
+
+                # Parse resolution if connected
+                if connected:
+                    resolution_match = _RE_RES.search(line)
+                    if resolution_match:
+                        current_display.width = int(resolution_match.group(1))
+                        current_display.height = int(resolution_match.group(2))
+
+            # Brightness information
+            elif 'Brightness:' in line and current_display:
+                brightness_match = _RE_BRIGHT.search(line)
+                if brightness_match:
+                    brightness = float(brightness_match.group(1))
+                    current_display.brightness = int(brightness * 100)
+
+            # Refresh rate information
+            elif '*' in line and '+' in line and current_display:
+                # Current mode line
+                rate_match = _RE_ACTIVE_RATE.search(line)
+                if rate_match:
+                    current_display.refresh_rate = float(rate_match.group(1))
+
+        # Add last display
+        if current_display:
+            displays.append(current_display)
+
+        return displays
 
     async def _detect_displays_wayland(self) -> List[DisplayInfo]:
         """Detect displays using wlr-randr (Wayland)"""
         try:
-            result = subprocess.run(['wlr-randr'],
-                                  capture_output=True, text=True, timeout=10)
+            returncode, output = await self._run_command('wlr-randr', timeout=10)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 return []
 
             displays = []
             current_display = None
 
-            for line in result.stdout.split('\n'):
+            for line in output.split('\n'):
                 line = line.strip()
 
                 if line and not line.startswith(' '):
@@ -230,7 +446,7 @@ class DisplayManager:
 
                 elif line.startswith('current') and current_display:
                     # Parse current mode
-                    match = re.search(r'(\d+) x (\d+) @ ([\d.]+) Hz', line)
+                    match = _RE_WL_MODE.search(line)
                     if match:
                         current_display.width = int(match.group(1))
                         current_display.height = int(match.group(2))
@@ -248,21 +464,14 @@ class DisplayManager:
         """Detect displays using DRM interface"""
         try:
             displays = []
-            drm_path = Path("/sys/class/drm")
-
-            if not drm_path.exists():
-                return []
-
-            for connector_path in drm_path.glob("card0-*"):
-                connector_name = connector_path.name.replace("card0-", "")
 
+            for connector_name, connector_path in self._get_drm_paths().items():
                 # Check connection status
                 status_file = connector_path / "status"
                 if not status_file.exists():
                     continue
 
-                with open(status_file, 'r') as f:
-                    status = f.read().strip()
+                status = _read_small(status_file).strip()
 
                 connected = status == "connected"
 
@@ -281,14 +490,13 @@ class DisplayManager:
                     # Try to get mode information
                     modes_file = connector_path / "modes"
                     if modes_file.exists():
-                        with open(modes_file, 'r') as f:
-                            modes = f.read().strip().split('\n')
-                            if modes and modes[0]:
-                                # Parse first mode (usually current)
-                                mode_match = re.match(r'(\d+)x(\d+)', modes[0])
-                                if mode_match:
-                                    display.width = int(mode_match.group(1))
-                                    display.height = int(mode_match.group(2))
+                        modes = _read_small(modes_file, 4096).strip().split('\n')
+                        if modes and modes[0]:
+                            # Parse first mode (usually current)
+                            mode_match = _RE_DRM_MODE.match(modes[0])
+                            if mode_match:
+                                display.width = int(mode_match.group(1))
+                                display.height = int(mode_match.group(2))
 
                 displays.append(display)
 
@@ -297,21 +505,33 @@ class DisplayManager:
         except Exception:
             return []
 
+    def _get_drm_paths(self) -> Dict[str, Path]:
+        """Connector name -> DRM sysfs directory, rescanned after hotplug"""
+        if self._drm_paths is None:
+            self._drm_paths = {
+                connector_path.name.replace("card0-", ""): connector_path
+                for connector_path in Path("/sys/class/drm").glob("card0-*")
+            }
+        return self._drm_paths
+
     async def _check_advanced_features(self, display: DisplayInfo):
         """Check for HDR, G-Sync, and other advanced features"""
         try:
-            # Check for HDR support
-            display.hdr_supported = await self._check_hdr_support(display.connector)
-
-            # Check for G-Sync/FreeSync support
-            display.gsync_supported = await self._check_gsync_support(display.connector)
-
-            # Check current HDR status
-            if display.hdr_supported:
+            # Check for HDR and G-Sync/FreeSync support (independent probes)
+            display.hdr_supported, display.gsync_supported = await asyncio.gather(
+                self._check_hdr_support(display.connector),
+                self._check_gsync_support(display.connector)
+            )
+
+            # Check current HDR and G-Sync status
+            if display.hdr_supported and display.gsync_supported:
+                display.hdr_enabled, display.gsync_enabled = await asyncio.gather(
+                    self._get_hdr_status(display.connector),
+                    self._get_gsync_status(display.connector)
+                )
+            elif display.hdr_supported:
                 display.hdr_enabled = await self._get_hdr_status(display.connector)
-
-            # Check G-Sync status
-            if display.gsync_supported:
+            elif display.gsync_supported:
                 display.gsync_enabled = await self._get_gsync_status(display.connector)
 
             # Legion-specific features
@@ -325,23 +545,19 @@ class DisplayManager:
     async def _check_hdr_support(self, connector: str) -> bool:
         """Check if display supports HDR"""
         try:
-            # Check DRM properties
-            drm_path = Path(f"/sys/class/drm/card0-{connector}")
-            if drm_path.exists():
-                # Look for HDR-related properties
-                for prop_file in drm_path.glob("*hdr*"):
-                    return True
+            drm_path = self._get_drm_paths().get(connector)
+            if drm_path is None:
+                return False
 
-                # Check EDID for HDR capabilities
-                edid_file = drm_path / "edid"
-                if edid_file.exists():
-                    # This would require EDID parsing - simplified check
-                    with open(edid_file, 'rb') as f:
-                        edid_data = f.read()
-                        # HDR support indicated by specific EDID extensions
-                        return len(edid_data) > 256  # Extended EDID usually indicates HDR
+            # HDR support is advertised in the first EDID extension (CTA-861),
+            # so the base block plus one extension (256 bytes) is enough
+            fd = os.open(drm_path / "edid", os.O_RDONLY)
+            try:
+                edid_data = os.pread(fd, 256, 0)
+            finally:
+                os.close(fd)
 
-            return False
+            return _edid_has_hdr_metadata(edid_data)
 
         except Exception:
             return False
@@ -349,15 +565,24 @@ class DisplayManager:
     async def _check_gsync_support(self, connector: str) -> bool:
         """Check if display supports G-Sync/FreeSync"""
         try:
-            # Check for variable refresh rate support
-            result = subprocess.run(['xrandr', '--props'],
-                                  capture_output=True, text=True, timeout=5)
+            # Prefer the per-connector DRM vrr_capable property
+            drm_path = self._get_drm_paths().get(connector)
+            if drm_path is not None:
+                try:
+                    return _read_small(drm_path / "vrr_capable").strip() == "1"
+                except FileNotFoundError:
+                    pass
+
+            # Fall back to scanning xrandr properties (X11 only)
+            if self._session_type != 'x11':
+                return False
+
+            returncode, output = await self._run_command('xrandr', '--props', timeout=5)
 
-            if result.returncode == 0:
-                output = result.stdout
+            if returncode == 0:
+                output = output.lower()
                 # Look for VRR-related properties
-                return any(vrr_prop in output.lower() for vrr_prop in
-                          ['vrr', 'freesync', 'g-sync', 'adaptive sync'])
+                return any(vrr_prop in output for vrr_prop in _VRR_PROPS)
 
             return False
 
@@ -379,10 +604,8 @@ class DisplayManager:
                     max_brightness_file = path / "max_brightness"
 
                     if brightness_file.exists() and max_brightness_file.exists():
-                        with open(brightness_file, 'r') as f:
-                            current = int(f.read().strip())
-                        with open(max_brightness_file, 'r') as f:
-                            maximum = int(f.read().strip())
+                        current = int(_read_small(brightness_file))
+                        maximum = int(_read_small(max_brightness_file))
 
                         return int((current / maximum) * 100)
 
@@ -402,50 +625,77 @@ class DisplayManager:
                 # Set brightness for specific external display
                 return await self._set_external_brightness(display, brightness)
 
-            # Set internal display brightness
-            for brightness_path in self.brightness_paths:
-                path = Path(brightness_path)
-                if path.exists():
-                    brightness_file = path / "brightness"
-                    max_brightness_file = path / "max_brightness"
-
-                    if brightness_file.exists() and max_brightness_file.exists():
-                        with open(max_brightness_file, 'r') as f:
-                            maximum = int(f.read().strip())
+            # Coalesce rapid internal brightness changes (slider drags,
+            # auto-brightness) into a single write of the latest value
+            self._pending_brightness = brightness
+            if self._brightness_task is None or self._brightness_task.done():
+                self._brightness_task = asyncio.ensure_future(self._flush_brightness())
 
-                        target_brightness = int((brightness / 100) * maximum)
+            return await asyncio.shield(self._brightness_task)
 
-                        # Write brightness
-                        subprocess.run(['sudo', 'sh', '-c',
-                                      f'echo {target_brightness} > {brightness_file}'],
-                                     check=True, timeout=5)
+        except Exception as e:
+            self.logger.error(f"Failed to set brightness: {e}")
+            return False
 
-                        self.logger.info(f"Set brightness to {brightness}%")
-                        return True
+    async def _flush_brightness(self) -> bool:
+        """Write the most recent pending internal brightness value"""
+        await asyncio.sleep(self.brightness_debounce)
 
+        brightness = self._pending_brightness
+        self._pending_brightness = None
+        if brightness is None:
             return False
 
+        try:
+            return self._write_internal_brightness(brightness)
         except Exception as e:
             self.logger.error(f"Failed to set brightness: {e}")
             return False
 
+    def _write_internal_brightness(self, brightness: int) -> bool:
+        """Write brightness (0-100%) to the first available backlight"""
+        for brightness_path in self.brightness_paths:
+            path = Path(brightness_path)
+            if path.exists():
+                brightness_file = path / "brightness"
+                max_brightness_file = path / "max_brightness"
+
+                if brightness_file.exists() and max_brightness_file.exists():
+                    maximum = int(_read_small(max_brightness_file))
+
+                    target_brightness = int((brightness / 100) * maximum)
+
+                    # Write brightness
+                    _write_sysfs(brightness_file, target_brightness)
+
+                    self.logger.info(f"Set brightness to {brightness}%")
+                    return True
+
+        return False
+
     async def _get_external_brightness(self, connector: str) -> Optional[int]:
         """Get brightness for external display"""
         try:
-            # Try xrandr for external displays
-            result = subprocess.run(['xrandr', '--verbose'],
-                                  capture_output=True, text=True, timeout=5)
-
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for i, line in enumerate(lines):
-                    if connector in line and 'connected' in line:
-                        # Look for brightness in following lines
-                        for j in range(i + 1, min(i + 10, len(lines))):
-                            if 'Brightness:' in lines[j]:
-                                brightness_match = re.search(r'Brightness: ([\d.]+)', lines[j])
-                                if brightness_match:
-                                    return int(float(brightness_match.group(1)) * 100)
+            # Try xrandr for external displays (--current skips mode probing)
+            returncode, output = await self._run_command('xrandr', '--verbose', '--current',
+                                                         timeout=5)
+
+            if returncode != 0:
+                return None
+
+            # Single pass: find the connector block, stop at the first
+            # Brightness line or at the next output header
+            in_block = False
+            for line in output.splitlines():
+                header_match = _RE_HEADER.match(line)
+                if header_match:
+                    if in_block:
+                        return None
+                    in_block = header_match.group(1) == connector
+                elif in_block:
+                    brightness_match = _RE_BRIGHT.search(line)
+                    if brightness_match:
+                        return int(float(brightness_match.group(1)) * 100)
 
             return None
 
@@ -457,13 +707,13 @@ class DisplayManager:
         try:
             brightness_value = brightness / 100.0
 
-            result = subprocess.run(['xrandr', '--output', connector,
-                                   '--brightness', str(brightness_value)],
-                                  check=True, timeout=10)
+            await self._run_command('xrandr', '--output', connector,
+                                    '--brightness', str(brightness_value),
+                                    timeout=10, check=True)
 
-            return result.returncode == 0
+            return True
 
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
     async def enable_hdr(self, display: str = None) -> bool:
@@ -488,8 +738,8 @@ class DisplayManager:
 
             # Try xrandr properties
             try:
-                subprocess.run(['xrandr', '--output', display, '--set', 'HDR', '1'],
-                              check=True, timeout=10)
+                await self._run_command('xrandr', '--output', display, '--set', 'HDR', '1',
+                                        timeout=10, check=True)
                 display_info.hdr_enabled = True
                 return True
             except subprocess.CalledProcessError:
@@ -518,8 +768,8 @@ class DisplayManager:
 
             # Try xrandr
             try:
-                subprocess.run(['xrandr', '--output', display, '--set', 'HDR', '0'],
-                              check=True, timeout=10)
+                await self._run_command('xrandr', '--output', display, '--set', 'HDR', '0',
+                                        timeout=10, check=True)
                 if display in self.current_displays:
                     self.current_displays[display].hdr_enabled = False
                 return True
@@ -646,17 +896,14 @@ class DisplayManager:
             self.logger.info(f"Setting refresh rate to {rate}Hz on {display}")
 
             # Use xrandr to set refresh rate
-            result = subprocess.run(['xrandr', '--output', display, '--rate', str(rate)],
-                                  check=True, timeout=10)
+            await self._run_command('xrandr', '--output', display, '--rate', str(rate),
+                                    timeout=10, check=True)
 
-            if result.returncode == 0:
-                if display in self.current_displays:
-                    self.current_displays[display].refresh_rate = rate
-                return True
-
-            return False
+            if display in self.current_displays:
+                self.current_displays[display].refresh_rate = rate
+            return True
 
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
             self.logger.error(f"Failed to set refresh rate: {e}")
             return False
 
@@ -691,24 +938,99 @@ class DisplayManager:
                 await self.monitoring_task
             except asyncio.CancelledError:
                 pass
+        await self.flush_settings()
         self.logger.info("Display monitoring stopped")
 
     async def _monitoring_loop(self):
         """Display monitoring loop"""
-        while self.monitoring_active:
-            try:
-                # Re-detect displays periodically
-                await self.detect_displays()
+        hotplug_events = self._start_drm_monitor()
+        try:
+            while self.monitoring_active:
+                try:
+                    # Without hotplug events, re-detect displays periodically
+                    if not hotplug_events:
+                        self._drm_paths = None
+                        await self.detect_displays(force=True)
+
+                    # Auto-adjust settings if enabled
+                    if self.settings.auto_brightness:
+                        await self._auto_adjust_brightness()
+
+                    # Back off while the topology is stable
+                    topology = self._topology_snapshot()
+                    if topology == self._last_topology:
+                        self._monitor_interval = min(self._monitor_interval * 2,
+                                                     self.max_monitor_interval)
+                    else:
+                        self._monitor_interval = self.min_monitor_interval
+                    self._last_topology = topology
+
+                    await asyncio.sleep(self._monitor_interval)
+
+                except Exception as e:
+                    self.logger.error(f"Display monitoring error: {e}")
+                    await asyncio.sleep(self.min_monitor_interval)
+        finally:
+            self._stop_drm_monitor()
+
+    def _topology_snapshot(self) -> tuple:
+        """Hashable summary of the current display topology"""
+        return tuple(sorted(
+            (connector, display.connected, display.width, display.height, display.refresh_rate)
+            for connector, display in self.current_displays.items()
+        ))
+
+    def _start_drm_monitor(self) -> bool:
+        """Subscribe to DRM udev events, returns False if unavailable"""
+        if not HAS_PYUDEV:
+            return False
 
-                # Auto-adjust settings if enabled
-                if self.settings.auto_brightness:
-                    await self._auto_adjust_brightness()
+        try:
+            context = pyudev.Context()
+            monitor = pyudev.Monitor.from_netlink(context)
+            monitor.filter_by(subsystem='drm')
+            monitor.start()
 
-                await asyncio.sleep(30)  # Check every 30 seconds
+            asyncio.get_running_loop().add_reader(monitor.fileno(), self._on_drm_event)
+            self._drm_monitor = monitor
+            return True
 
-            except Exception as e:
-                self.logger.error(f"Display monitoring error: {e}")
-                await asyncio.sleep(30)
+        except Exception as e:
+            self.logger.warning(f"DRM hotplug monitoring unavailable, falling back to polling: {e}")
+            return False
+
+    def _stop_drm_monitor(self):
+        """Unsubscribe from DRM udev events"""
+        if self._drm_monitor is None:
+            return
+
+        try:
+            asyncio.get_running_loop().remove_reader(self._drm_monitor.fileno())
+        except Exception:
+            pass
+        self._drm_monitor = None
+
+    def _on_drm_event(self):
+        """Drain pending DRM events and schedule a single re-detection"""
+        while self._drm_monitor.poll(timeout=0) is not None:
+            pass
+
+        # Connectors may have appeared or disappeared
+        self._drm_paths = None
+        self._displays_dirty = True
+        self._drm_event_count += 1
+        self._monitor_interval = self.min_monitor_interval
+
+        if self._drm_refresh_task is None or self._drm_refresh_task.done():
+            self._drm_refresh_task = asyncio.ensure_future(self._refresh_displays())
+
+    async def _refresh_displays(self):
+        """Re-detect displays, once more if events arrived during the scan"""
+        while True:
+            event_count = self._drm_event_count
+            await self.detect_displays()
+            if self._drm_event_count == event_count:
+                break
 
     async def _auto_adjust_brightness(self):
         """Auto-adjust brightness based on ambient light or time"""
@@ -716,18 +1038,27 @@ class DisplayManager:
             # This is a simplified implementation
             # In practice, you'd use ambient light sensors or time-based adjustment
 
+            from datetime import datetime
+
             current_hour = datetime.now().hour
 
             if 6 <= current_hour <= 18:  # Daytime
-                target_brightness = 80
+                bucket, target_brightness = 'day', 80
             elif 18 <= current_hour <= 22:  # Evening
-                target_brightness = 60
+                bucket, target_brightness = 'evening', 60
             else:  # Night
-                target_brightness = 40
+                bucket, target_brightness = 'night', 40
+
+            # Target only changes with the time bucket, skip sysfs entirely until then
+            if bucket == self._last_auto_bucket:
+                return
 
             current_brightness = await self.get_brightness()
             if current_brightness and abs(current_brightness - target_brightness) > 10:
-                await self.set_brightness(target_brightness)
+                if not await self.set_brightness(target_brightness):
+                    return
+
+            self._last_auto_bucket = bucket
 
         except Exception as e:
             self.logger.error(f"Auto brightness adjustment failed: {e}")
@@ -746,11 +1077,8 @@ class DisplayManager:
     async def _write_kernel_param(self, param: str, value: str) -> bool:
         """Write parameter to kernel module"""
         try:
-            path = f"{self.kernel_module_path}/{param}"
-            subprocess.run(['sudo', 'sh', '-c', f'echo {value} > {path}'],
-                          check=True, timeout=5)
-            return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return _write_sysfs(f"{self.kernel_module_path}/{param}", value)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
             return False
 
     async def _read_kernel_param(self, param: str) -> Optional[str]:
@@ -758,14 +1086,32 @@ class DisplayManager:
         try:
             path = Path(f"{self.kernel_module_path}/{param}")
             if path.exists():
-                with open(path, 'r') as f:
-                    return f.read().strip()
+                return _read_small(path).strip()
         except Exception:
             pass
         return None
 
     async def save_settings(self):
-        """Save display settings"""
+        """Save display settings
+
+        Saves are coalesced: the first call schedules a write save_delay
+        seconds later, and calls made before it runs are folded into that
+        write, which reads the settings when it happens. Nothing is on disk
+        when this returns; await flush_settings() (stop_monitoring does)
+        before exiting.
+        """
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.ensure_future(self._flush_settings())
+
+    async def flush_settings(self):
+        """Wait for any pending settings save to complete"""
+        if self._save_task is not None:
+            await self._save_task
+
+    async def _flush_settings(self):
+        """Write current settings atomically after the coalescing delay"""
+        await asyncio.sleep(self.save_delay)
+
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -780,8 +1126,13 @@ class DisplayManager:
                 'power_saving_brightness': self.settings.power_saving_brightness
             }
 
-            with open(self.config_file, 'w') as f:
-                json.dump(settings_dict, f, indent=2)
+            # Write to a temp file and rename so a crash never leaves a torn file
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(settings_dict))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
 
         except Exception as e:
             self.logger.error(f"Failed to save display settings: {e}")
@@ -792,8 +1143,8 @@ class DisplayManager:
             if not self.config_file.exists():
                 return
 
-            with open(self.config_file, 'r') as f:
-                settings_dict = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                settings_dict = _loads(f.read())
 
             self.settings.auto_brightness = settings_dict.get('auto_brightness', False)
             self.settings.hdr_auto_switch = settings_dict.get('hdr_auto_switch', True)
@@ -829,6 +1180,7 @@ async def main():
     if current_brightness:
         print(f"Current brightness: {current_brightness}%")
 
+    await display_manager.stop_monitoring()
     print("Display manager test completed")
 
 if __name__ == "__main__":
@@ -8,17 +8,28 @@ Supports Legion Slim 7i Gen 9 (16IRX9)
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib, Gio, GObject, Pango
+from gi.repository import Gtk, Adw, Gdk, GLib, Gio, GObject, Pango
 import asyncio
+import functools
+import logging
 import os
 import sys
 import json
 import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional, Any, List
-import subprocess
 from datetime import datetime, timedelta
 
+# Run asyncio on the GLib main context when PyGObject supports it (3.50+)
+try:
+    from gi.events import GLibEventLoopPolicy
+    asyncio.set_event_loop_policy(GLibEventLoopPolicy())
+    HAS_GLIB_ASYNCIO = True
+except ImportError:
+    HAS_GLIB_ASYNCIO = False
+
 # Import core components
 try:
     from ..hardware.gpu_controller import LinuxGPUController
@@ -31,6 +42,88 @@ except ImportError:
     from hardware.rgb_controller import LinuxRGBController
     from ai.ai_controller import LinuxAIController
 
+logger = logging.getLogger("legion.gui")
+
+PERFORMANCE_MODES = ("quiet", "balanced", "performance", "custom")
+
+# Temperature color classes, indexed by tier (>=65, >=75, >=85 degrees)
+TEMP_CLASSES = ("temp-cool", "temp-normal", "temp-warning", "temp-critical")
+
+MONITORING_INTERVAL = 2  # seconds
+MONITORING_INTERVAL_INACTIVE = 10  # seconds, while the window is unfocused
+COMMIT_DELAY_MS = 150  # slider changes are coalesced over this window
+
+HWMON_ROOT = "/sys/class/hwmon"
+THERMAL_ROOT = "/sys/class/thermal"
+
+# hwmon chip name -> temperature sensor reported by its temp1_input
+HWMON_TEMP_CHIPS = {
+    "coretemp": "cpu",
+    "k10temp": "cpu",
+    "amdgpu": "gpu",
+    "nouveau": "gpu",
+}
+
+# thermal zone type -> temperature sensor
+THERMAL_ZONE_TYPES = {
+    "x86_pkg_temp": "cpu",
+    "TCPU": "cpu",
+}
+
+# Kernel module attributes (degrees / RPM) used when no generic sensor exists
+KERNEL_TEMP_PARAMS = {
+    "cpu": "cpu_temp",
+    "gpu": "gpu_temp",
+    "gpu_hotspot": "gpu_hotspot",
+    "vrm": "vrm_temp",
+}
+KERNEL_FAN_PARAMS = {
+    "fan1": "fan1_speed",
+    "fan2": "fan2_speed",
+}
+
+# Kernel module attributes the GUI may write
+KERNEL_WRITABLE_PARAMS = frozenset({
+    "performance_mode", "cpu_pl1", "cpu_pl2", "gpu_tgp",
+    "fan1_target", "fan2_target", "rgb_mode", "rgb_brightness",
+})
+
+# Kernel module attribute returning all of the above in a single read
+KERNEL_SENSOR_BATCH = "sensor_batch"
+SENSOR_BATCH_KEYS = ("cpu", "gpu", "gpu_hotspot", "vrm", "fan1", "fan2")
+
+SENSOR_MAP_FILE = Path.home() / '.cache' / 'legion-toolkit' / 'hwmon_map.json'
+
+@functools.lru_cache(maxsize=None)
+def _kernel_module_loaded(path: str) -> bool:
+    """Check (once per process) whether the legion kernel module is loaded"""
+    return os.path.exists(path)
+
+def _scandir_paths(root: str, prefix: str = "") -> List[str]:
+    """List entry paths under root (sorted by name), optionally filtered by prefix"""
+    try:
+        with os.scandir(root) as it:
+            entries = [(e.name, e.path) for e in it if e.name.startswith(prefix)]
+    except OSError:
+        return []
+    return [path for _, path in sorted(entries)]
+
+def _scandir_names(path: str) -> set:
+    """Names of the entries in a directory"""
+    try:
+        with os.scandir(path) as it:
+            return {e.name for e in it}
+    except OSError:
+        return set()
+
+def _read_sysfs_text(path: str) -> Optional[str]:
+    """Read a short sysfs text attribute"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
 class LegionToolkitApp(Adw.Application):
     """Main Legion Toolkit application class"""
 
@@ -40,22 +133,187 @@ class LegionToolkitApp(Adw.Application):
             flags=Gio.ApplicationFlags.FLAGS_NONE
         )
         self.window = None
+        self._css_provider = None
+
+    def do_startup(self):
+        """Startup callback - install the stylesheet once for the display"""
+        Adw.Application.do_startup(self)
+
+        self._css_provider = Gtk.CssProvider()
+        self._css_provider.load_from_data(CSS_DATA)
+        Gtk.StyleContext.add_provider_for_display(
+            Gdk.Display.get_default(),
+            self._css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
 
     def do_activate(self):
         """Activate callback - create and show main window"""
         if not self.window:
             self.window = LegionToolkitWindow(application=self)
+            if self.window.privileged:
+                self.window.start_background_tasks()
         self.window.present()
 
+CSS_DATA = b"""
+#temp-cpu, #temp-gpu, #temp-gpu_hotspot, #temp-vrm {
+    font-family: monospace;
+    font-weight: bold;
+}
+
+.temp-cool {
+    color: #3498db;
+}
+
+.temp-normal {
+    color: #2ecc71;
+}
+
+.temp-warning {
+    color: #f39c12;
+}
+
+.temp-critical {
+    color: #e74c3c;
+}
+
+.info-label {
+    font-weight: bold;
+}
+
+.info-value {
+    color: #666;
+}
+
+.status-bar {
+    background-color: #f8f9fa;
+    border-top: 1px solid #dee2e6;
+    font-size: 0.9em;
+}
+"""
+
+@functools.lru_cache(maxsize=64)
+def hex_to_rgba(hex_color: str) -> Gdk.RGBA:
+    """Convert hex color to RGBA (cached; callers must not mutate the result)"""
+    rgba = Gdk.RGBA()
+    rgba.parse(hex_color)
+    return rgba
+
+DEFAULT_ZONE_RGBA = hex_to_rgba("#FF0000")
+RGB_ZONE_LABELS = ("Zone 1:", "Zone 2:", "Zone 3:", "Zone 4:")
+
+# RGB mode index -> (color controls visible, speed control visible)
+RGB_MODE_CONTROLS = {
+    0: (False, False),  # Off
+    1: (True, False),   # Static
+    2: (True, True),    # Breathing
+    3: (False, True),   # Rainbow
+    4: (False, True),   # Wave
+    5: (True, True),    # Custom
+}
+
+def _margins(widget: Gtk.Widget, n: int = 10):
+    """Set the same margin on all four sides of a widget"""
+    props = widget.props
+    props.margin_top = props.margin_bottom = props.margin_start = props.margin_end = n
+
+def _hbox(spacing: int = 10) -> Gtk.Box:
+    """Create a horizontal box"""
+    return Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=spacing)
+
+@dataclass(frozen=True)
+class SystemInfo:
+    """Static system description shown on the overview page"""
+    model: str = "Legion Slim 7i Gen 9 (16IRX9)"
+    cpu: str = "Intel Core i9-14900HX"
+    gpu: str = "NVIDIA RTX 4070 Laptop GPU"
+
+SYSTEM_INFO = SystemInfo()
+SYSTEM_INFO_ROWS = (
+    ("Model:", SYSTEM_INFO.model),
+    ("CPU:", SYSTEM_INFO.cpu),
+    ("GPU:", SYSTEM_INFO.gpu),
+)
+
+class SensorPoller:
+    """Read sensors on a background thread and publish the latest snapshot
+
+    The UI only reads ``snapshot``; replacing the tuple is a single
+    attribute store, so no lock is needed and the GTK thread never
+    blocks on a slow sysfs read.
+    """
+
+    def __init__(self, read_fn):
+        self.read_fn = read_fn
+        self.snapshot: tuple = ({}, {})
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, interval: float):
+        """Start polling every interval seconds"""
+        self.stop()
+        # Fresh event per run so a thread still finishing a read cannot be revived
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval, self._stop_event),
+            name="legion-sensors", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Ask the polling thread to exit"""
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
+
+    def join(self, timeout: float = 1.0):
+        """Wait for the polling thread to exit"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, interval: float, stop_event: threading.Event):
+        while not stop_event.is_set():
+            try:
+                self.snapshot = self.read_fn()
+            except Exception as e:
+                logger.debug("Sensor poll failed: %s", e)
+            stop_event.wait(interval)
+
+class CommitDebouncer:
+    """Coalesce rapid value changes so only the latest value per key is applied"""
+
+    def __init__(self, delay_ms: int = COMMIT_DELAY_MS):
+        self.delay_ms = delay_ms
+        self._pending: Dict[str, tuple] = {}
+        self._timer_id: Optional[int] = None
+
+    def schedule(self, key: str, callback, *args):
+        """Queue callback(*args), replacing any pending call for the same key"""
+        self._pending[key] = (callback, args)
+        if self._timer_id is None:
+            self._timer_id = GLib.timeout_add(self.delay_ms, self._on_timeout)
+
+    def flush(self):
+        """Apply all pending calls immediately"""
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+        pending, self._pending = self._pending, {}
+        for callback, args in pending.values():
+            callback(*args)
+
+    def _on_timeout(self) -> bool:
+        self._timer_id = None
+        self.flush()
+        return GLib.SOURCE_REMOVE
+
 class ThermalWidget(Gtk.Box):
     """Custom thermal monitoring widget"""
 
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        self.set_margin_top(10)
-        self.set_margin_bottom(10)
-        self.set_margin_start(10)
-        self.set_margin_end(10)
+        _margins(self)
 
         # Title
         title = Gtk.Label()
@@ -69,8 +327,11 @@ class ThermalWidget(Gtk.Box):
         self.temp_grid.set_row_spacing(8)
         self.append(self.temp_grid)
 
-        # Temperature labels
+        self._commits = CommitDebouncer()
+
+        # Temperature labels and their current color class
         self.temp_labels = {}
+        self.temp_classes: Dict[str, str] = {}
         self.create_temp_display("CPU", 0, 0)
         self.create_temp_display("GPU", 1, 0)
         self.create_temp_display("GPU Hotspot", 0, 1)
@@ -82,15 +343,13 @@ class ThermalWidget(Gtk.Box):
         fan_frame.set_margin_top(10)
 
         fan_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        fan_box.set_margin_top(10)
-        fan_box.set_margin_bottom(10)
-        fan_box.set_margin_start(10)
-        fan_box.set_margin_end(10)
+        _margins(fan_box)
 
         # Fan 1 control
-        fan1_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        fan1_box = _hbox()
         fan1_label = Gtk.Label(label="Fan 1:")
         fan1_label.set_size_request(60, -1)
+        self._last_fan1_rpm = -1
         self.fan1_rpm_label = Gtk.Label(label="0 RPM")
         self.fan1_rpm_label.set_size_request(80, -1)
 
@@ -106,9 +365,10 @@ class ThermalWidget(Gtk.Box):
         fan_box.append(fan1_box)
 
         # Fan 2 control
-        fan2_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        fan2_box = _hbox()
         fan2_label = Gtk.Label(label="Fan 2:")
         fan2_label.set_size_request(60, -1)
+        self._last_fan2_rpm = -1
         self.fan2_rpm_label = Gtk.Label(label="0 RPM")
         self.fan2_rpm_label.set_size_request(80, -1)
 
@@ -128,63 +388,73 @@ class ThermalWidget(Gtk.Box):
 
     def create_temp_display(self, name: str, col: int, row: int):
         """Create temperature display elements"""
+        key = name.lower().replace(" ", "_")
+
         label = Gtk.Label(label=f"{name}:")
         label.set_halign(Gtk.Align.START)
 
         temp_label = Gtk.Label(label="--°C")
         temp_label.set_halign(Gtk.Align.END)
-        temp_label.add_css_class("temperature-display")
+        # Styled by widget name (see CSS_DATA) rather than a per-label class
+        temp_label.set_name(f"temp-{key}")
 
         self.temp_grid.attach(label, col * 2, row, 1, 1)
         self.temp_grid.attach(temp_label, col * 2 + 1, row, 1, 1)
 
-        self.temp_labels[name.lower().replace(" ", "_")] = temp_label
+        self.temp_labels[key] = temp_label
 
     def update_temperatures(self, temps: Dict[str, float]):
         """Update temperature displays"""
         for key, label in self.temp_labels.items():
-            if key in temps:
-                temp = temps[key]
-                color_class = self.get_temp_color_class(temp)
-                label.set_markup(f'<span class="{color_class}">{temp:.1f}°C</span>')
+            temp = temps.get(key)
+            if temp is None:
+                continue
+
+            # Swap the color class only on tier transitions
+            color_class = self.get_temp_color_class(temp)
+            last_class = self.temp_classes.get(key)
+            if color_class != last_class:
+                if last_class:
+                    label.remove_css_class(last_class)
+                label.add_css_class(color_class)
+                self.temp_classes[key] = color_class
+
+            label.set_text(f"{temp:.1f}°C")
 
     def update_fan_speeds(self, fan1_rpm: int, fan2_rpm: int):
         """Update fan speed displays"""
-        self.fan1_rpm_label.set_text(f"{fan1_rpm} RPM")
-        self.fan2_rpm_label.set_text(f"{fan2_rpm} RPM")
+        # Steady RPM is the common case; skip the label update then
+        if fan1_rpm != self._last_fan1_rpm:
+            self.fan1_rpm_label.set_text("%d RPM" % fan1_rpm)
+            self._last_fan1_rpm = fan1_rpm
+        if fan2_rpm != self._last_fan2_rpm:
+            self.fan2_rpm_label.set_text("%d RPM" % fan2_rpm)
+            self._last_fan2_rpm = fan2_rpm
 
     def get_temp_color_class(self, temp: float) -> str:
         """Get CSS class for temperature color coding"""
-        if temp >= 85:
-            return "temp-critical"
-        elif temp >= 75:
-            return "temp-warning"
-        elif temp >= 65:
-            return "temp-normal"
-        else:
-            return "temp-cool"
+        # Each threshold reached adds one tier (bools sum as 0/1)
+        return TEMP_CLASSES[(temp >= 65) + (temp >= 75) + (temp >= 85)]
 
     def on_fan1_changed(self, scale):
         """Handle fan 1 speed change"""
-        value = int(scale.get_value())
-        # This would be connected to the hardware controller
-        print(f"Setting fan 1 to {value}%")
+        self._commits.schedule("fan1", self.apply_fan_speed, 1, int(scale.get_value()))
 
     def on_fan2_changed(self, scale):
         """Handle fan 2 speed change"""
-        value = int(scale.get_value())
+        self._commits.schedule("fan2", self.apply_fan_speed, 2, int(scale.get_value()))
+
+    def apply_fan_speed(self, fan: int, value: int):
+        """Apply fan speed once the slider settles"""
         # This would be connected to the hardware controller
-        print(f"Setting fan 2 to {value}%")
+        logger.debug("Setting fan %d to %d%%", fan, value)
 
 class RGBWidget(Gtk.Box):
     """RGB lighting control widget"""
 
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        self.set_margin_top(10)
-        self.set_margin_bottom(10)
-        self.set_margin_start(10)
-        self.set_margin_end(10)
+        _margins(self)
 
         # Title
         title = Gtk.Label()
@@ -192,15 +462,14 @@ class RGBWidget(Gtk.Box):
         title.set_halign(Gtk.Align.START)
         self.append(title)
 
+        self._commits = CommitDebouncer()
+
         # Mode selection
         mode_frame = Gtk.Frame()
         mode_frame.set_label("Lighting Mode")
 
         mode_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        mode_box.set_margin_top(10)
-        mode_box.set_margin_bottom(10)
-        mode_box.set_margin_start(10)
-        mode_box.set_margin_end(10)
+        _margins(mode_box)
 
         # Mode dropdown
         self.mode_dropdown = Gtk.DropDown.new_from_strings([
@@ -216,11 +485,8 @@ class RGBWidget(Gtk.Box):
         brightness_frame = Gtk.Frame()
         brightness_frame.set_label("Brightness")
 
-        brightness_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        brightness_box.set_margin_top(10)
-        brightness_box.set_margin_bottom(10)
-        brightness_box.set_margin_start(10)
-        brightness_box.set_margin_end(10)
+        brightness_box = _hbox()
+        _margins(brightness_box)
 
         brightness_label = Gtk.Label(label="Brightness:")
         self.brightness_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0, 100, 5)
@@ -239,28 +505,27 @@ class RGBWidget(Gtk.Box):
         self.color_frame.set_label("Color Selection")
 
         color_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        color_box.set_margin_top(10)
-        color_box.set_margin_bottom(10)
-        color_box.set_margin_start(10)
-        color_box.set_margin_end(10)
+        _margins(color_box)
 
         # Zone color pickers
-        self.zone_colors = []
-        for i in range(4):
-            zone_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        zone_buttons = []
+        for zone_index, zone_label_text in enumerate(RGB_ZONE_LABELS):
+            zone_box = _hbox()
 
-            zone_label = Gtk.Label(label=f"Zone {i+1}:")
+            zone_label = Gtk.Label(label=zone_label_text)
             zone_label.set_size_request(60, -1)
 
             color_button = Gtk.ColorButton()
-            color_button.set_rgba(self.hex_to_rgba("#FF0000"))
-            color_button.connect("color-set", self.on_color_changed, i)
+            color_button.set_rgba(DEFAULT_ZONE_RGBA)
+            color_button.zone_index = zone_index
+            color_button.connect("color-set", self.on_color_changed)
 
             zone_box.append(zone_label)
             zone_box.append(color_button)
             color_box.append(zone_box)
 
-            self.zone_colors.append(color_button)
+            zone_buttons.append(color_button)
+        self.zone_colors = tuple(zone_buttons)
 
         self.color_frame.set_child(color_box)
         self.append(self.color_frame)
@@ -269,11 +534,8 @@ class RGBWidget(Gtk.Box):
         self.speed_frame = Gtk.Frame()
         self.speed_frame.set_label("Animation Speed")
 
-        speed_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        speed_box.set_margin_top(10)
-        speed_box.set_margin_bottom(10)
-        speed_box.set_margin_start(10)
-        speed_box.set_margin_end(10)
+        speed_box = _hbox()
+        _margins(speed_box)
 
         speed_label = Gtk.Label(label="Speed:")
         self.speed_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 1, 10, 1)
@@ -290,61 +552,50 @@ class RGBWidget(Gtk.Box):
         # Update visibility based on initial mode
         self.update_controls_visibility(0)  # Off mode
 
-    def hex_to_rgba(self, hex_color: str):
-        """Convert hex color to RGBA"""
-        from gi.repository import Gdk
-        rgba = Gdk.RGBA()
-        rgba.parse(hex_color)
-        return rgba
-
     def on_mode_changed(self, dropdown, _):
         """Handle mode change"""
         selected = dropdown.get_selected()
         self.update_controls_visibility(selected)
-        print(f"RGB mode changed to: {selected}")
+        logger.debug("RGB mode changed to: %d", selected)
 
     def update_controls_visibility(self, mode: int):
         """Update control visibility based on mode"""
-        modes = ["off", "static", "breathing", "rainbow", "wave", "custom"]
-
-        if mode == 0:  # Off
-            self.color_frame.set_visible(False)
-            self.speed_frame.set_visible(False)
-        elif mode in [1, 2]:  # Static, Breathing
-            self.color_frame.set_visible(True)
-            self.speed_frame.set_visible(mode == 2)  # Speed for breathing only
-        elif mode in [3, 4]:  # Rainbow, Wave
-            self.color_frame.set_visible(False)
-            self.speed_frame.set_visible(True)
-        elif mode == 5:  # Custom
-            self.color_frame.set_visible(True)
-            self.speed_frame.set_visible(True)
+        controls = RGB_MODE_CONTROLS.get(mode)
+        if controls is None:
+            return
+
+        color_visible, speed_visible = controls
+        self.color_frame.set_visible(color_visible)
+        self.speed_frame.set_visible(speed_visible)
 
     def on_brightness_changed(self, scale):
         """Handle brightness change"""
-        value = int(scale.get_value())
-        print(f"RGB brightness changed to: {value}%")
+        self._commits.schedule("brightness", self.apply_brightness, int(scale.get_value()))
 
-    def on_color_changed(self, button, zone: int):
-        """Handle color change for specific zone"""
+    def apply_brightness(self, value: int):
+        """Apply brightness once the slider settles"""
+        logger.debug("RGB brightness changed to: %d%%", value)
+
+    def on_color_changed(self, button):
+        """Handle color change for the button's zone"""
         rgba = button.get_rgba()
-        hex_color = f"#{int(rgba.red*255):02X}{int(rgba.green*255):02X}{int(rgba.blue*255):02X}"
-        print(f"Zone {zone+1} color changed to: {hex_color}")
+        logger.debug("Zone %d color changed to: #%02X%02X%02X", button.zone_index + 1,
+                     int(rgba.red * 255), int(rgba.green * 255), int(rgba.blue * 255))
 
     def on_speed_changed(self, scale):
         """Handle speed change"""
-        value = int(scale.get_value())
-        print(f"RGB speed changed to: {value}")
+        self._commits.schedule("speed", self.apply_speed, int(scale.get_value()))
+
+    def apply_speed(self, value: int):
+        """Apply animation speed once the slider settles"""
+        logger.debug("RGB speed changed to: %d", value)
 
 class AIWidget(Gtk.Box):
     """AI optimization widget"""
 
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        self.set_margin_top(10)
-        self.set_margin_bottom(10)
-        self.set_margin_start(10)
-        self.set_margin_end(10)
+        _margins(self)
 
         # Title
         title = Gtk.Label()
@@ -357,10 +608,7 @@ class AIWidget(Gtk.Box):
         status_frame.set_label("AI Status")
 
         status_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        status_box.set_margin_top(10)
-        status_box.set_margin_bottom(10)
-        status_box.set_margin_start(10)
-        status_box.set_margin_end(10)
+        _margins(status_box)
 
         self.ai_status_label = Gtk.Label(label="AI Optimization: Disabled")
         self.ai_status_label.set_halign(Gtk.Align.START)
@@ -374,7 +622,7 @@ class AIWidget(Gtk.Box):
         self.append(status_frame)
 
         # Control buttons
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        button_box = _hbox()
         button_box.set_halign(Gtk.Align.CENTER)
 
         self.start_button = Gtk.Button(label="Start AI Monitoring")
@@ -405,6 +653,7 @@ class AIWidget(Gtk.Box):
         self.recommendations_text = Gtk.TextView()
         self.recommendations_text.set_editable(False)
         self.recommendations_text.set_wrap_mode(Gtk.WrapMode.WORD)
+        self._last_recommendations: List[str] = []
 
         rec_scroll.set_child(self.recommendations_text)
         rec_frame.set_child(rec_scroll)
@@ -415,18 +664,18 @@ class AIWidget(Gtk.Box):
         self.start_button.set_sensitive(False)
         self.stop_button.set_sensitive(True)
         self.ai_status_label.set_text("AI Optimization: Active")
-        print("Starting AI monitoring...")
+        logger.debug("Starting AI monitoring...")
 
     def on_stop_clicked(self, button):
         """Handle stop AI monitoring"""
         self.start_button.set_sensitive(True)
         self.stop_button.set_sensitive(False)
         self.ai_status_label.set_text("AI Optimization: Disabled")
-        print("Stopping AI monitoring...")
+        logger.debug("Stopping AI monitoring...")
 
     def on_optimize_clicked(self, button):
         """Handle run optimization"""
-        print("Running AI optimization...")
+        logger.debug("Running AI optimization...")
         self.update_recommendations([
             "Recommended: Increase CPU PL2 to 125W for better performance",
             "Thermal prediction: CPU will reach 78°C in next 60 seconds",
@@ -435,8 +684,30 @@ class AIWidget(Gtk.Box):
 
     def update_recommendations(self, recommendations: List[str]):
         """Update recommendations display"""
+        recommendations = list(recommendations)
+        if recommendations == self._last_recommendations:
+            return
+
+        # Keep the unchanged leading lines and only rewrite the tail
+        prefix = 0
+        for old, new in zip(self._last_recommendations, recommendations):
+            if old != new:
+                break
+            prefix += 1
+
         buffer = self.recommendations_text.get_buffer()
-        buffer.set_text("\n".join(f"• {rec}" for rec in recommendations))
+        buffer.begin_user_action()
+        if prefix == 0:
+            buffer.set_text("\n".join(["• " + rec for rec in recommendations]))
+        else:
+            _, start = buffer.get_iter_at_line(prefix - 1)
+            start.forward_to_line_end()
+            buffer.delete(start, buffer.get_end_iter())
+            buffer.insert(buffer.get_end_iter(),
+                          "".join(["\n• " + rec for rec in recommendations[prefix:]]))
+        buffer.end_user_action()
+
+        self._last_recommendations = recommendations
 
 class LegionToolkitWindow(Adw.ApplicationWindow):
     """Main application window"""
@@ -448,8 +719,21 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         self.set_default_size(1200, 800)
         self.set_icon_name("legion-toolkit")
 
+        # Sensor file descriptors, opened once and read with pread()
+        self._temp_fds: Dict[str, tuple] = {}
+        self._fan_fds: Dict[str, int] = {}
+        self._batch_fd: Optional[int] = None
+        self._param_fds: Dict[str, int] = {}
+        self._tasks: List[asyncio.Future] = []
+        self._monitor = None  # asyncio task or GLib source id
+        self._sensor_poller = SensorPoller(self.read_sensors)
+        self._last_monitor_error = ""
+        self._last_monitor_error_time = 0.0
+        self._commits = CommitDebouncer()
+
         # Check for root privileges
-        if os.geteuid() != 0:
+        self.privileged = os.geteuid() == 0
+        if not self.privileged:
             self.show_permission_dialog()
             return
 
@@ -459,16 +743,15 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         self.ai_controller = LinuxAIController()
 
         self.kernel_module_path = "/sys/kernel/legion_laptop"
+        self._kmod_loaded = _kernel_module_loaded(self.kernel_module_path)
+        self._param_paths = {
+            param: os.path.join(self.kernel_module_path, param)
+            for param in (*KERNEL_TEMP_PARAMS.values(), *KERNEL_FAN_PARAMS.values(),
+                          *KERNEL_WRITABLE_PARAMS)
+        }
 
         # Setup UI
         self.setup_ui()
-        self.setup_css()
-
-        # Start monitoring
-        GLib.timeout_add_seconds(2, self.update_monitoring_data)
-
-        # Initialize controllers
-        self.initialize_controllers()
 
     def setup_ui(self):
         """Setup the user interface"""
@@ -511,13 +794,22 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         stack_switcher.set_halign(Gtk.Align.CENTER)
         self.header_bar.set_title_widget(stack_switcher)
 
-        # Add pages to stack
-        self.add_overview_page()
-        self.add_thermal_page()
-        self.add_power_page()
-        self.add_rgb_page()
-        self.add_ai_page()
-        self.add_advanced_page()
+        # Add page placeholders; each page is built the first time it is shown
+        pages = (
+            ("overview", "Overview", self.build_overview_page),
+            ("thermal", "Thermal", self.build_thermal_page),
+            ("power", "Power", self.build_power_page),
+            ("rgb", "RGB", self.build_rgb_page),
+            ("ai", "AI Optimization", self.build_ai_page),
+            ("advanced", "Advanced", self.build_advanced_page),
+        )
+        self._page_builders = {}
+        for name, title, builder in pages:
+            self.main_stack.add_titled(Gtk.Box(orientation=Gtk.Orientation.VERTICAL), name, title)
+            self._page_builders[name] = builder
+
+        self.main_stack.connect("notify::visible-child-name", self.on_page_switch)
+        self.on_page_switch(self.main_stack, None)
 
         self.main_box.append(self.main_stack)
 
@@ -531,16 +823,25 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         self.status_bar.add_css_class("status-bar")
         self.main_box.append(self.status_bar)
 
-    def add_overview_page(self):
-        """Add overview page"""
+    def on_page_switch(self, stack, _pspec):
+        """Build a page the first time it becomes visible"""
+        name = stack.get_visible_child_name()
+        builder = self._page_builders.pop(name, None)
+        if builder is None:
+            return
+
+        page = builder()
+        page.set_vexpand(True)
+        # Fill the placeholder in place so the switcher order is unchanged
+        stack.get_child_by_name(name).append(page)
+
+    def build_overview_page(self) -> Gtk.Widget:
+        """Build overview page"""
         scroll = Gtk.ScrolledWindow()
         scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
         page_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=20)
-        page_box.set_margin_top(20)
-        page_box.set_margin_bottom(20)
-        page_box.set_margin_start(20)
-        page_box.set_margin_end(20)
+        _margins(page_box, 20)
 
         # System information card
         sys_frame = Gtk.Frame()
@@ -549,18 +850,12 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         sys_grid = Gtk.Grid()
         sys_grid.set_column_spacing(20)
         sys_grid.set_row_spacing(10)
-        sys_grid.set_margin_top(15)
-        sys_grid.set_margin_bottom(15)
-        sys_grid.set_margin_start(15)
-        sys_grid.set_margin_end(15)
+        _margins(sys_grid, 15)
 
         # System info labels
-        info_items = [
-            ("Model:", "Legion Slim 7i Gen 9 (16IRX9)"),
-            ("CPU:", "Intel Core i9-14900HX"),
-            ("GPU:", "NVIDIA RTX 4070 Laptop GPU"),
-            ("Kernel Module:", "Loaded" if Path(self.kernel_module_path).exists() else "Not Loaded"),
-        ]
+        info_items = SYSTEM_INFO_ROWS + (
+            ("Kernel Module:", "Loaded" if self._kmod_loaded else "Not Loaded"),
+        )
 
         for i, (label, value) in enumerate(info_items):
             label_widget = Gtk.Label(label=label)
@@ -582,13 +877,10 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         actions_frame.set_label("Quick Actions")
 
         actions_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        actions_box.set_margin_top(15)
-        actions_box.set_margin_bottom(15)
-        actions_box.set_margin_start(15)
-        actions_box.set_margin_end(15)
+        _margins(actions_box, 15)
 
         # Conservation mode toggle
-        conservation_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        conservation_box = _hbox()
         conservation_label = Gtk.Label(label="Battery Conservation Mode")
         conservation_label.set_hexpand(True)
         conservation_label.set_halign(Gtk.Align.START)
@@ -601,7 +893,7 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         actions_box.append(conservation_box)
 
         # Hybrid graphics toggle
-        hybrid_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        hybrid_box = _hbox()
         hybrid_label = Gtk.Label(label="Hybrid Graphics Mode")
         hybrid_label.set_hexpand(True)
         hybrid_label.set_halign(Gtk.Align.START)
@@ -617,36 +909,30 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         page_box.append(actions_frame)
 
         scroll.set_child(page_box)
-        self.main_stack.add_titled(scroll, "overview", "Overview")
+        return scroll
 
-    def add_thermal_page(self):
-        """Add thermal monitoring page"""
+    def build_thermal_page(self) -> Gtk.Widget:
+        """Build thermal monitoring page"""
         self.thermal_widget = ThermalWidget()
-        self.main_stack.add_titled(self.thermal_widget, "thermal", "Thermal")
+        return self.thermal_widget
 
-    def add_power_page(self):
-        """Add power management page"""
+    def build_power_page(self) -> Gtk.Widget:
+        """Build power management page"""
         scroll = Gtk.ScrolledWindow()
         scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
         page_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=20)
-        page_box.set_margin_top(20)
-        page_box.set_margin_bottom(20)
-        page_box.set_margin_start(20)
-        page_box.set_margin_end(20)
+        _margins(page_box, 20)
 
         # CPU power limits
         cpu_frame = Gtk.Frame()
         cpu_frame.set_label("CPU Power Management")
 
         cpu_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        cpu_box.set_margin_top(15)
-        cpu_box.set_margin_bottom(15)
-        cpu_box.set_margin_start(15)
-        cpu_box.set_margin_end(15)
+        _margins(cpu_box, 15)
 
         # PL1 (Base Power)
-        pl1_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        pl1_box = _hbox()
         pl1_label = Gtk.Label(label="Base Power (PL1):")
         pl1_label.set_size_request(120, -1)
 
@@ -661,7 +947,7 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         cpu_box.append(pl1_box)
 
         # PL2 (Turbo Power)
-        pl2_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        pl2_box = _hbox()
         pl2_label = Gtk.Label(label="Turbo Power (PL2):")
         pl2_label.set_size_request(120, -1)
 
@@ -683,13 +969,10 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         gpu_frame.set_label("GPU Power Management")
 
         gpu_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        gpu_box.set_margin_top(15)
-        gpu_box.set_margin_bottom(15)
-        gpu_box.set_margin_start(15)
-        gpu_box.set_margin_end(15)
+        _margins(gpu_box, 15)
 
         # TGP (Total Graphics Power)
-        tgp_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        tgp_box = _hbox()
         tgp_label = Gtk.Label(label="GPU Power (TGP):")
         tgp_label.set_size_request(120, -1)
 
@@ -707,41 +990,35 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         page_box.append(gpu_frame)
 
         scroll.set_child(page_box)
-        self.main_stack.add_titled(scroll, "power", "Power")
+        return scroll
 
-    def add_rgb_page(self):
-        """Add RGB lighting page"""
+    def build_rgb_page(self) -> Gtk.Widget:
+        """Build RGB lighting page"""
         self.rgb_widget = RGBWidget()
-        self.main_stack.add_titled(self.rgb_widget, "rgb", "RGB")
+        return self.rgb_widget
 
-    def add_ai_page(self):
-        """Add AI optimization page"""
+    def build_ai_page(self) -> Gtk.Widget:
+        """Build AI optimization page"""
         self.ai_widget = AIWidget()
-        self.main_stack.add_titled(self.ai_widget, "ai", "AI Optimization")
+        return self.ai_widget
 
-    def add_advanced_page(self):
-        """Add advanced settings page"""
+    def build_advanced_page(self) -> Gtk.Widget:
+        """Build advanced settings page"""
         scroll = Gtk.ScrolledWindow()
         scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
         page_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=20)
-        page_box.set_margin_top(20)
-        page_box.set_margin_bottom(20)
-        page_box.set_margin_start(20)
-        page_box.set_margin_end(20)
+        _margins(page_box, 20)
 
         # GPU overclocking
         gpu_frame = Gtk.Frame()
         gpu_frame.set_label("GPU Overclocking")
 
         gpu_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        gpu_box.set_margin_top(15)
-        gpu_box.set_margin_bottom(15)
-        gpu_box.set_margin_start(15)
-        gpu_box.set_margin_end(15)
+        _margins(gpu_box, 15)
 
         # Core clock offset
-        core_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        core_box = _hbox()
         core_label = Gtk.Label(label="Core Clock Offset:")
         core_label.set_size_request(140, -1)
 
@@ -755,7 +1032,7 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         gpu_box.append(core_box)
 
         # Memory clock offset
-        mem_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        mem_box = _hbox()
         mem_label = Gtk.Label(label="Memory Clock Offset:")
         mem_label.set_size_request(140, -1)
 
@@ -769,7 +1046,7 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         gpu_box.append(mem_box)
 
         # Apply/Reset buttons
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        button_box = _hbox()
         button_box.set_halign(Gtk.Align.CENTER)
 
         apply_button = Gtk.Button(label="Apply Overclock")
@@ -786,69 +1063,231 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
         page_box.append(gpu_frame)
 
         scroll.set_child(page_box)
-        self.main_stack.add_titled(scroll, "advanced", "Advanced")
-
-    def setup_css(self):
-        """Setup custom CSS styling"""
-        css_provider = Gtk.CssProvider()
-        css_data = """
-        .temperature-display {
-            font-family: monospace;
-            font-weight: bold;
-        }
+        return scroll
 
-        .temp-cool {
-            color: #3498db;
-        }
+    def open_sensor_fds(self):
+        """Open sensor files once for repeated pread()"""
+        self.close_sensor_fds()
 
-        .temp-normal {
-            color: #2ecc71;
-        }
+        # Prefer the kernel module's batched attribute: one read per tick
+        self._batch_fd = self._open_sensor(
+            os.path.join(self.kernel_module_path, KERNEL_SENSOR_BATCH))
+        if self._batch_fd is not None:
+            return
 
-        .temp-warning {
-            color: #f39c12;
-        }
+        sensors = self._load_sensor_map()
+        if sensors is None:
+            sensors = self._discover_sensors()
+            self._save_sensor_map(sensors)
+
+        for key, sensor in sensors["temps"].items():
+            fd = self._open_sensor(sensor["path"])
+            if fd is not None:
+                self._temp_fds[key] = (fd, sensor["scale"])
+
+        for fan, sensor in sensors["fans"].items():
+            fd = self._open_sensor(sensor["path"])
+            if fd is not None:
+                self._fan_fds[fan] = fd
+
+    def _discover_sensors(self) -> Dict[str, Dict[str, Any]]:
+        """Resolve sensor paths (hwmon -> thermal zone -> kernel module)"""
+        temps: Dict[str, Any] = {}
+        fans: Dict[str, Any] = {}
+
+        # hwmon chips, identified by their name attribute. One scandir per
+        # chip replaces an exists() probe per candidate attribute.
+        for base in _scandir_paths(HWMON_ROOT):
+            files = _scandir_names(base)
+            if "name" not in files:
+                continue
+            name_path = os.path.join(base, "name")
+            name = _read_sysfs_text(name_path)
+
+            key = HWMON_TEMP_CHIPS.get(name)
+            if key and key not in temps and "temp1_input" in files:
+                temps[key] = {"path": os.path.join(base, "temp1_input"), "scale": 1000.0,
+                              "ident": [name_path, name]}
+
+            for fan in KERNEL_FAN_PARAMS:
+                if fan not in fans and f"{fan}_input" in files:
+                    fans[fan] = {"path": os.path.join(base, f"{fan}_input"),
+                                 "ident": [name_path, name]}
+
+        # Thermal zones
+        for base in _scandir_paths(THERMAL_ROOT, "thermal_zone"):
+            type_path = os.path.join(base, "type")
+            zone_type = _read_sysfs_text(type_path)
+
+            key = THERMAL_ZONE_TYPES.get(zone_type)
+            path = os.path.join(base, "temp")
+            if key and key not in temps and os.path.exists(path):
+                temps[key] = {"path": path, "scale": 1000.0, "ident": [type_path, zone_type]}
+
+        # Legion kernel module (EC readings)
+        for key, param in KERNEL_TEMP_PARAMS.items():
+            path = os.path.join(self.kernel_module_path, param)
+            if key not in temps and os.path.exists(path):
+                temps[key] = {"path": path, "scale": 1.0, "ident": None}
+
+        for fan, param in KERNEL_FAN_PARAMS.items():
+            path = os.path.join(self.kernel_module_path, param)
+            if fan not in fans and os.path.exists(path):
+                fans[fan] = {"path": path, "ident": None}
+
+        return {"temps": temps, "fans": fans}
+
+    def _load_sensor_map(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the cached sensor map if it still matches this system"""
+        try:
+            with open(SENSOR_MAP_FILE) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
 
-        .temp-critical {
-            color: #e74c3c;
-        }
+        if cached.get("kernel") != os.uname().release:
+            return None
 
-        .info-label {
-            font-weight: bold;
-        }
+        # hwmon/thermal zone numbering can change between boots
+        for group in ("temps", "fans"):
+            for sensor in cached.get(group, {}).values():
+                ident = sensor.get("ident")
+                if ident and _read_sysfs_text(ident[0]) != ident[1]:
+                    return None
 
-        .info-value {
-            color: #666;
-        }
+        # The kernel module may have been (un)loaded since the map was written
+        if cached.get("kmod") != _kernel_module_loaded(self.kernel_module_path):
+            return None
 
-        .status-bar {
-            background-color: #f8f9fa;
-            border-top: 1px solid #dee2e6;
-            font-size: 0.9em;
-        }
-        """
+        return cached
 
-        css_provider.load_from_data(css_data.encode('utf-8'))
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+    def _save_sensor_map(self, sensors: Dict[str, Dict[str, Any]]):
+        """Persist the resolved sensor map for the next start"""
+        try:
+            SENSOR_MAP_FILE.parent.mkdir(parents=True, exist_ok=True)
+            data = dict(sensors, kernel=os.uname().release,
+                        kmod=_kernel_module_loaded(self.kernel_module_path))
+            with open(SENSOR_MAP_FILE, 'w') as f:
+                json.dump(data, f, indent=2)
+        except OSError:
+            pass
 
-    def initialize_controllers(self):
-        """Initialize hardware controllers"""
-        async def init_async():
+    @staticmethod
+    def _open_sensor(path: str) -> Optional[int]:
+        """Open a sysfs sensor file for repeated pread()"""
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read_sensor(fd: int) -> Optional[int]:
+        """Read an integer sensor value from an open sysfs fd"""
+        try:
+            return int(os.pread(fd, 16, 0))
+        except (OSError, ValueError):
+            return None
+
+    def close_sensor_fds(self):
+        """Close cached sensor file descriptors"""
+        fds = [fd for fd, _ in self._temp_fds.values()]
+        fds.extend(self._fan_fds.values())
+        if self._batch_fd is not None:
+            fds.append(self._batch_fd)
+            self._batch_fd = None
+        for fd in fds:
             try:
-                await self.gpu_controller.initialize()
-                await self.rgb_controller.initialize()
-                await self.ai_controller.initialize()
+                os.close(fd)
+            except OSError:
+                pass
+        self._temp_fds.clear()
+        self._fan_fds.clear()
+
+    def do_close_request(self):
+        """Stop background tasks and release sensor descriptors"""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        self.stop_monitoring()
+        self._sensor_poller.join()
+        self._commits.flush()
+        self.close_sensor_fds()
+        self.close_param_fds()
+        return False
 
-                GLib.idle_add(self.update_status, "Controllers initialized successfully")
-            except Exception as e:
-                GLib.idle_add(self.update_status, f"Controller initialization failed: {e}")
+    def start_background_tasks(self):
+        """Start controller initialization and sensor monitoring"""
+        self.open_sensor_fds()
+
+        # Only poll sensors while the window is on screen
+        self.connect("map", self.start_monitoring)
+        self.connect("unmap", self.stop_monitoring)
+        self.connect("notify::is-active", self.on_active_changed)
+        if self.get_mapped():
+            self.start_monitoring()
+
+        if HAS_GLIB_ASYNCIO:
+            # Runs as an asyncio task on the GTK main loop
+            self._tasks.append(asyncio.ensure_future(self.initialize_controllers()))
+        else:
+            # Run in thread to avoid blocking UI
+            threading.Thread(
+                target=lambda: asyncio.run(self.initialize_controllers()), daemon=True
+            ).start()
 
-        # Run in thread to avoid blocking UI
-        threading.Thread(target=lambda: asyncio.run(init_async()), daemon=True).start()
+    async def initialize_controllers(self):
+        """Initialize hardware controllers"""
+        try:
+            # Controllers are independent; overlap their I/O-bound setup
+            await asyncio.gather(
+                self.gpu_controller.initialize(),
+                self.rgb_controller.initialize(),
+                self.ai_controller.initialize(),
+            )
+            message = "Controllers initialized successfully"
+        except Exception as e:
+            message = f"Controller initialization failed: {e}"
+
+        if HAS_GLIB_ASYNCIO:
+            self.update_status(message)
+        else:
+            GLib.idle_add(self.update_status, message)
+
+    def start_monitoring(self, *_args):
+        """Start periodic monitoring (slower while the window is unfocused)"""
+        if self._monitor is not None:
+            return
+
+        interval = MONITORING_INTERVAL if self.is_active() else MONITORING_INTERVAL_INACTIVE
+        self._sensor_poller.start(interval)
+        if HAS_GLIB_ASYNCIO:
+            self._monitor = asyncio.ensure_future(self.monitoring_loop(interval))
+        else:
+            self._monitor = GLib.timeout_add_seconds(interval, self.update_monitoring_data)
+
+    def stop_monitoring(self, *_args):
+        """Stop periodic monitoring"""
+        if self._monitor is None:
+            return
+
+        self._sensor_poller.stop()
+        if HAS_GLIB_ASYNCIO:
+            self._monitor.cancel()
+        else:
+            GLib.source_remove(self._monitor)
+        self._monitor = None
+
+    def on_active_changed(self, *_args):
+        """Restart monitoring at the rate matching the focus state"""
+        if self._monitor is not None:
+            self.stop_monitoring()
+            self.start_monitoring()
+
+    async def monitoring_loop(self, interval: int):
+        """Periodically refresh monitoring data"""
+        while True:
+            await asyncio.sleep(interval)
+            self.update_monitoring_data()
 
     def update_status(self, message: str):
         """Update status bar"""
@@ -858,79 +1297,117 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
     def update_monitoring_data(self) -> bool:
         """Update monitoring data from hardware"""
         try:
-            # Read temperatures
-            temps = {}
-            temp_sensors = ["cpu_temp", "gpu_temp"]
-
-            for sensor in temp_sensors:
-                temp = self.read_kernel_param(sensor)
-                if temp:
-                    temps[sensor] = float(temp)
+            # Latest readings from the background poller; no I/O here
+            temps, fans = self._sensor_poller.snapshot
 
             # Update thermal widget
             if hasattr(self, 'thermal_widget'):
                 self.thermal_widget.update_temperatures(temps)
 
-            # Read fan speeds
-            fan1_rpm = self.read_kernel_param("fan1_speed")
-            fan2_rpm = self.read_kernel_param("fan2_speed")
-
-            if fan1_rpm and fan2_rpm and hasattr(self, 'thermal_widget'):
-                self.thermal_widget.update_fan_speeds(int(fan1_rpm), int(fan2_rpm))
+            if "fan1" in fans and "fan2" in fans and hasattr(self, 'thermal_widget'):
+                self.thermal_widget.update_fan_speeds(fans["fan1"], fans["fan2"])
 
         except Exception as e:
-            print(f"Monitoring update error: {e}")
+            # The same failure tends to repeat every tick; log it at most every 5 s
+            now = time.monotonic()
+            error = str(e)
+            if error != self._last_monitor_error or now - self._last_monitor_error_time >= 5:
+                logger.debug("Monitoring update error: %s", error)
+                self._last_monitor_error = error
+                self._last_monitor_error_time = now
 
         return True  # Continue timer
 
-    def read_kernel_param(self, param: str) -> Optional[str]:
-        """Read parameter from kernel module"""
-        try:
-            path = Path(self.kernel_module_path) / param
-            if path.exists():
-                return path.read_text().strip()
-        except Exception:
-            pass
-        return None
+    def read_sensors(self) -> tuple:
+        """Read all temperatures and fan speeds as (temps, fans)"""
+        temps: Dict[str, float] = {}
+        fans: Dict[str, int] = {}
+
+        if self._batch_fd is not None:
+            try:
+                values = os.pread(self._batch_fd, 64, 0).split()
+                readings = dict(zip(SENSOR_BATCH_KEYS, map(int, values)))
+            except (OSError, ValueError):
+                return temps, fans
+            for key in KERNEL_FAN_PARAMS:
+                if key in readings:
+                    fans[key] = readings.pop(key)
+            temps.update((key, float(value)) for key, value in readings.items())
+            return temps, fans
+
+        for key, (fd, scale) in self._temp_fds.items():
+            value = self._read_sensor(fd)
+            if value is not None:
+                temps[key] = value / scale
+
+        for fan, fd in self._fan_fds.items():
+            value = self._read_sensor(fd)
+            if value is not None:
+                fans[fan] = value
+
+        return temps, fans
 
     def write_kernel_param(self, param: str, value: str) -> bool:
         """Write parameter to kernel module"""
+        # Only known attributes, one token each: param is joined into a path
+        if param not in KERNEL_WRITABLE_PARAMS or not value or not value.isprintable() or " " in value:
+            self.update_status(f"Refusing to write {param}={value!r}")
+            return False
+
         try:
-            path = Path(self.kernel_module_path) / param
-            if path.exists():
-                subprocess.run(['sudo', 'sh', '-c', f'echo {value} > {path}'], check=True)
-                return True
-        except Exception as e:
+            # The window only runs as root, so write the attribute directly
+            fd = self._param_fds.get(param)
+            if fd is None:
+                fd = os.open(self._param_paths[param], os.O_WRONLY)
+                self._param_fds[param] = fd
+            os.pwrite(fd, f"{value}\n".encode(), 0)
+            return True
+        except FileNotFoundError:
+            pass
+        except OSError as e:
             self.update_status(f"Failed to write {param}: {e}")
         return False
 
+    def close_param_fds(self):
+        """Close cached kernel parameter write descriptors"""
+        for fd in self._param_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._param_fds.clear()
+
     # Event handlers
     def on_performance_mode_changed(self, dropdown, _):
         """Handle performance mode change"""
-        modes = ["quiet", "balanced", "performance", "custom"]
-        selected = dropdown.get_selected()
-        mode = modes[selected]
+        mode = PERFORMANCE_MODES[dropdown.get_selected()]
+        # Keyboard scrolling through the dropdown can emit several changes
+        self._commits.schedule("performance_mode", self.apply_performance_mode, mode)
 
+    def apply_performance_mode(self, mode: str):
+        """Write the performance mode once the selection settles"""
         if self.write_kernel_param("performance_mode", mode):
             self.update_status(f"Performance mode set to {mode}")
 
     def on_pl1_changed(self, scale):
         """Handle PL1 change"""
-        value = int(scale.get_value())
-        if self.write_kernel_param("cpu_pl1", str(value)):
-            self.update_status(f"CPU PL1 set to {value}W")
+        self._commits.schedule("cpu_pl1", self.apply_power_limit,
+                               "cpu_pl1", "CPU PL1", int(scale.get_value()))
 
     def on_pl2_changed(self, scale):
         """Handle PL2 change"""
-        value = int(scale.get_value())
-        if self.write_kernel_param("cpu_pl2", str(value)):
-            self.update_status(f"CPU PL2 set to {value}W")
+        self._commits.schedule("cpu_pl2", self.apply_power_limit,
+                               "cpu_pl2", "CPU PL2", int(scale.get_value()))
 
     def on_tgp_changed(self, scale):
         """Handle TGP change"""
-        value = int(scale.get_value())
-        if self.write_kernel_param("gpu_tgp", str(value)):
-            self.update_status(f"GPU TGP set to {value}W")
+        self._commits.schedule("gpu_tgp", self.apply_power_limit,
+                               "gpu_tgp", "GPU TGP", int(scale.get_value()))
+
+    def apply_power_limit(self, param: str, name: str, value: int):
+        """Write a power limit once the slider settles"""
+        if self.write_kernel_param(param, str(value)):
+            self.update_status(f"{name} set to {value}W")
 
     def show_permission_dialog(self):
         """Show permission error dialog"""
@@ -967,6 +1444,7 @@ class LegionToolkitWindow(Adw.ApplicationWindow):
 
 def main():
     """Main entry point"""
+    logging.basicConfig(level=logging.INFO)
     app = LegionToolkitApp()
     return app.run(sys.argv)
 
@@ -8,12 +8,20 @@ Supports NVIDIA RTX 4070 Laptop GPU optimization for Legion Slim 7i Gen 9
 import os
 import subprocess
 import json
+import math
 import time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import logging
 import asyncio
+import numpy as np
+
+try:
+    import pynvml
+    HAS_PYNVML = True
+except ImportError:
+    HAS_PYNVML = False
 
 @dataclass
 class GPUInfo:
@@ -38,17 +46,89 @@ class GPUSettings:
     fan_curve: List[Tuple[int, int]]  # [(temp, speed), ...]
     performance_mode: str  # 'maximum', 'balanced', 'quiet'
 
+# Fan speed drop (percent) needed before a curve lowers the target
+FAN_CURVE_HYSTERESIS = 5
+
+# One monitor_gpu sample per row
+GPU_SAMPLE_DTYPE = np.dtype([
+    ('timestamp', 'f8'),
+    ('temperature', 'f4'),
+    ('power_draw', 'f4'),
+    ('clock_core', 'i4'),
+    ('clock_memory', 'i4'),
+    ('fan_speed', 'i2'),
+    ('utilization', 'f4'),
+    ('memory_used', 'i4'),
+])
+
+def _parse_text(value: bytes) -> str:
+    return value.decode(errors='replace')
+
+def _parse_optional_float(value: bytes) -> float:
+    """Parse a float field that may be '[Not Supported]' / '[N/A]'"""
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+def _parse_optional_int(value: bytes) -> int:
+    """Parse an int field that may be '[Not Supported]' / '[N/A]'"""
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+# nvidia-smi query fields and their parsers, in GPUInfo field order
+NVIDIA_QUERY_FIELDS = (
+    ('name', _parse_text),
+    ('driver_version', _parse_text),
+    ('memory.total', int),
+    ('memory.used', int),
+    ('temperature.gpu', float),
+    ('power.draw', _parse_optional_float),
+    ('clocks.gr', int),
+    ('clocks.mem', int),
+    ('fan.speed', _parse_optional_int),
+    ('utilization.gpu', float),
+)
+NVIDIA_FIELD_PARSERS = tuple(parse for _, parse in NVIDIA_QUERY_FIELDS)
+NVIDIA_QUERY = (
+    'nvidia-smi',
+    '--query-gpu=' + ','.join(field for field, _ in NVIDIA_QUERY_FIELDS),
+    '--format=csv,noheader,nounits',
+)
+
 class LinuxGPUController:
     """
     Advanced GPU controller for Linux providing feature parity with Windows
     Supports NVIDIA and AMD GPUs with full overclocking capabilities
     """
 
+    # NVIDIA driver hints shared by every mode, applied once per process
+    NVIDIA_ENV = {
+        '__GL_ALLOW_UNOFFICIAL_PROTOCOL': '1',
+        '__GL_THREADED_OPTIMIZATIONS': '1',
+        '__GL_SHADER_CACHE': '1',
+        '__GL_MAX_FRAMES_ALLOWED': '1',  # Reduce input lag
+        'CUDA_CACHE_MAXSIZE': '2147483648',  # 2GB CUDA cache
+    }
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self._nvml_handle = None
+        self._nvidia_env_applied = False
+        # Already root (e.g. from the GUI): skip the sudo fork and PAM round-trip
+        self._sudo: Tuple[str, ...] = () if os.geteuid() == 0 else ('sudo',)
         self.nvidia_available = self._check_nvidia_support()
-        self.amd_available = self._check_amd_support()
+        # Only one vendor path is ever used; skip the AMD probe if NVIDIA works
+        self.amd_available = False if self.nvidia_available else self._check_amd_support()
         self.gpu_info = None
+        self.info_ttl = 1.5  # seconds a GPU info query stays fresh
+        self._gpu_info_time = 0.0
+        # Fan curve followed on every fresh GPU reading, and the last target
+        # speed written for it
+        self._active_fan_curve: Optional[List[Tuple[int, int]]] = None
+        self._fan_target: Optional[int] = None
         self.current_settings = GPUSettings(
             power_limit=115,
             core_offset=0,
@@ -59,6 +139,22 @@ class LinuxGPUController:
 
     def _check_nvidia_support(self) -> bool:
         """Check if NVIDIA GPU and tools are available"""
+        # No device node means no loaded driver; don't fork nvidia-smi
+        if not os.path.exists('/dev/nvidia0'):
+            return False
+
+        if HAS_PYNVML:
+            # In-process NVML avoids forking nvidia-smi for every query
+            try:
+                pynvml.nvmlInit()
+                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                if 'RTX 4070' in self._nvml_str(pynvml.nvmlDeviceGetName(handle)):
+                    self._nvml_handle = handle
+                    return True
+                return False
+            except pynvml.NVMLError as e:
+                self.logger.debug(f"NVML unavailable, falling back to nvidia-smi: {e}")
+
         try:
             result = subprocess.run(['nvidia-smi', '--query-gpu=name', '--format=csv,noheader'],
                                   capture_output=True, text=True, timeout=10)
@@ -68,6 +164,9 @@ class LinuxGPUController:
 
     def _check_amd_support(self) -> bool:
         """Check if AMD GPU and tools are available"""
+        if not os.path.exists('/sys/module/amdgpu'):
+            return False
+
         try:
             result = subprocess.run(['rocm-smi', '--showid'],
                                   capture_output=True, text=True, timeout=10)
@@ -75,6 +174,30 @@ class LinuxGPUController:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
+    async def _run_command(self, *args: str, timeout: float = 30,
+                           check: bool = False) -> Tuple[int, str, str]:
+        """Run a command without blocking the event loop, returns (returncode, stdout, stderr)"""
+        returncode, stdout, stderr = await self._run_command_raw(*args, timeout=timeout, check=check)
+        return returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
+    async def _run_command_raw(self, *args: str, timeout: float = 30,
+                               check: bool = False) -> Tuple[int, bytes, bytes]:
+        """Like _run_command but returns stdout/stderr undecoded"""
+        proc = await asyncio.create_subprocess_exec(*args,
+                                                    stdout=asyncio.subprocess.PIPE,
+                                                    stderr=asyncio.subprocess.PIPE)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(list(args), timeout)
+
+        if check and proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, list(args), stdout, stderr)
+
+        return proc.returncode, stdout, stderr
+
     async def initialize(self) -> bool:
         """Initialize GPU controller and detect hardware"""
         try:
@@ -93,13 +216,13 @@ class LinuxGPUController:
         """Initialize NVIDIA GPU support"""
         try:
             # Enable persistence mode for stable overclocking
-            subprocess.run(['sudo', 'nvidia-smi', '-pm', '1'], check=True)
+            await self._run_command(*self._sudo, 'nvidia-smi', '-pm', '1', check=True)
 
             # Set performance mode
-            subprocess.run(['sudo', 'nvidia-smi', '-ac', '5001,1560'], check=True)
+            await self._run_command(*self._sudo, 'nvidia-smi', '-ac', '5001,1560', check=True)
 
-            # Enable overclocking support
-            os.environ['__GL_ALLOW_UNOFFICIAL_PROTOCOL'] = '1'
+            # Enable overclocking support and driver hints
+            self._apply_nvidia_env()
 
             self.logger.info("NVIDIA GPU initialized successfully")
             return True
@@ -108,11 +231,17 @@ class LinuxGPUController:
             self.logger.error(f"NVIDIA initialization failed: {e}")
             return False
 
+    def _apply_nvidia_env(self):
+        """Export the static NVIDIA driver hints (no-op after the first call)"""
+        if not self._nvidia_env_applied:
+            os.environ.update(self.NVIDIA_ENV)
+            self._nvidia_env_applied = True
+
     async def _initialize_amd(self) -> bool:
         """Initialize AMD GPU support"""
         try:
             # Set performance mode for AMD GPU
-            subprocess.run(['sudo', 'rocm-smi', '--setperflevel', 'high'], check=True)
+            await self._run_command(*self._sudo, 'rocm-smi', '--setperflevel', 'high', check=True)
 
             self.logger.info("AMD GPU initialized successfully")
             return True
@@ -133,33 +262,60 @@ class LinuxGPUController:
             self.logger.error(f"Failed to get GPU info: {e}")
             return None
 
-    async def _get_nvidia_info(self) -> GPUInfo:
-        """Get NVIDIA GPU information"""
-        query = [
-            'nvidia-smi',
-            '--query-gpu=name,driver_version,memory.total,memory.used,temperature.gpu,power.draw,clocks.gr,clocks.mem,fan.speed,utilization.gpu',
-            '--format=csv,noheader,nounits'
-        ]
+    @staticmethod
+    def _nvml_str(value) -> str:
+        """NVML returns bytes with older bindings and str with newer ones"""
+        return value.decode() if isinstance(value, bytes) else value
 
-        result = subprocess.run(query, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            raise RuntimeError(f"nvidia-smi failed: {result.stderr}")
+    @staticmethod
+    def _nvml_value(default, func, *args):
+        """Call an NVML query, returning default when it is not supported"""
+        try:
+            return func(*args)
+        except pynvml.NVMLError:
+            return default
 
-        values = result.stdout.strip().split(', ')
+    def _get_nvml_info(self) -> GPUInfo:
+        """Get NVIDIA GPU information through NVML"""
+        handle = self._nvml_handle
+        memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
 
         return GPUInfo(
-            name=values[0],
-            driver_version=values[1],
-            memory_total=int(values[2]),
-            memory_used=int(values[3]),
-            temperature=float(values[4]),
-            power_draw=float(values[5]) if values[5] != '[Not Supported]' else 0.0,
-            clock_core=int(values[6]),
-            clock_memory=int(values[7]),
-            fan_speed=int(values[8]) if values[8] != '[Not Supported]' else 0,
-            utilization=float(values[9])
+            name=self._nvml_str(pynvml.nvmlDeviceGetName(handle)),
+            driver_version=self._nvml_str(pynvml.nvmlSystemGetDriverVersion()),
+            memory_total=memory.total // (1024 * 1024),
+            memory_used=memory.used // (1024 * 1024),
+            temperature=float(pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)),
+            power_draw=self._nvml_value(0, pynvml.nvmlDeviceGetPowerUsage, handle) / 1000.0,
+            clock_core=pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS),
+            clock_memory=pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM),
+            fan_speed=self._nvml_value(0, pynvml.nvmlDeviceGetFanSpeed, handle),
+            utilization=float(pynvml.nvmlDeviceGetUtilizationRates(handle).gpu)
         )
 
+    async def _get_nvidia_info(self) -> GPUInfo:
+        """Get NVIDIA GPU information (cached for info_ttl seconds)"""
+        now = time.monotonic()
+        if self.gpu_info is not None and now - self._gpu_info_time < self.info_ttl:
+            return self.gpu_info
+
+        if self._nvml_handle is not None:
+            self.gpu_info = self._get_nvml_info()
+            self._gpu_info_time = now
+            await self._follow_fan_curve(self.gpu_info.temperature)
+            return self.gpu_info
+
+        returncode, stdout, stderr = await self._run_command_raw(*NVIDIA_QUERY, timeout=10)
+        if returncode != 0:
+            raise RuntimeError(f"nvidia-smi failed: {stderr.decode(errors='replace')}")
+
+        # Parse the bytes directly; fields are in GPUInfo order
+        values = stdout.strip().split(b', ')
+        self.gpu_info = GPUInfo(*[convert(value) for convert, value in zip(NVIDIA_FIELD_PARSERS, values)])
+        self._gpu_info_time = now
+        await self._follow_fan_curve(self.gpu_info.temperature)
+        return self.gpu_info
+
     async def _get_amd_info(self) -> GPUInfo:
         """Get AMD GPU information"""
         # Simplified AMD implementation
@@ -184,15 +340,27 @@ class LinuxGPUController:
         try:
             if self.nvidia_available:
                 # Set power limit via nvidia-ml-py if available, otherwise use nvidia-smi
-                cmd = ['sudo', 'nvidia-smi', '-pl', str(power_limit)]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-
-                if result.returncode == 0:
+                if self._nvml_handle is not None:
+                    try:
+                        pynvml.nvmlDeviceSetPowerManagementLimit(self._nvml_handle, power_limit * 1000)
+                        self.current_settings.power_limit = power_limit
+                        self._gpu_info_time = 0.0
+                        self.logger.info(f"Power limit set to {power_limit}W")
+                        return True
+                    except pynvml.NVMLError as e:
+                        # Needs root; fall back to sudo nvidia-smi
+                        self.logger.debug(f"NVML power limit failed: {e}")
+
+                returncode, _, stderr = await self._run_command(
+                    *self._sudo, 'nvidia-smi', '-pl', str(power_limit))
+
+                if returncode == 0:
                     self.current_settings.power_limit = power_limit
+                    self._gpu_info_time = 0.0
                     self.logger.info(f"Power limit set to {power_limit}W")
                     return True
                 else:
-                    self.logger.error(f"Failed to set power limit: {result.stderr}")
+                    self.logger.error(f"Failed to set power limit: {stderr}")
                     return False
 
             return False
@@ -217,13 +385,14 @@ class LinuxGPUController:
                 ]
 
                 for cmd in commands:
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-                    if result.returncode != 0:
-                        self.logger.error(f"Failed to set clock offset: {result.stderr}")
+                    returncode, _, stderr = await self._run_command(*cmd)
+                    if returncode != 0:
+                        self.logger.error(f"Failed to set clock offset: {stderr}")
                         return False
 
                 self.current_settings.core_offset = core_offset
                 self.current_settings.memory_offset = memory_offset
+                self._gpu_info_time = 0.0
                 self.logger.info(f"Clock offsets set: Core +{core_offset}MHz, Memory +{memory_offset}MHz")
                 return True
 
@@ -233,19 +402,66 @@ class LinuxGPUController:
             self.logger.error(f"Error setting clock offsets: {e}")
             return False
 
+    @staticmethod
+    def _fan_speed_for_temp(fan_curve: List[Tuple[int, int]], temperature: float) -> int:
+        """Interpolate the fan speed for a temperature from (temp, speed) points"""
+        points = sorted(fan_curve)
+        if temperature <= points[0][0]:
+            return points[0][1]
+
+        for (t0, s0), (t1, s1) in zip(points, points[1:]):
+            if temperature <= t1:
+                return round(s0 + (s1 - s0) * (temperature - t0) / (t1 - t0))
+
+        return points[-1][1]
+
+    @staticmethod
+    def _validate_fan_curve(fan_curve: List[Tuple[int, int]]):
+        """Reject a fan curve before any of it is applied"""
+        if not 1 <= len(fan_curve) <= 8:
+            raise ValueError("Fan curve must have between 1 and 8 points")
+        for temp, speed in fan_curve:
+            if not 0 <= temp <= 110:
+                raise ValueError("Fan curve temperatures must be between 0 and 110°C")
+            if not 0 <= speed <= 100:
+                raise ValueError("Fan curve speeds must be between 0 and 100%")
+        if any(t0 >= t1 for (t0, _), (t1, _) in zip(fan_curve, fan_curve[1:])):
+            raise ValueError("Fan curve temperatures must be strictly increasing")
+
     async def set_fan_curve(self, fan_curve: List[Tuple[int, int]]) -> bool:
-        """Set custom fan curve for GPU"""
+        """Set custom fan curve for GPU
+
+        nvidia-settings only takes a single target speed, so the curve is
+        evaluated at the current GPU temperature (highest point if unknown)
+        and re-evaluated on every fresh GPU reading after that.
+        """
+        self._validate_fan_curve(fan_curve)
+
         try:
             if self.nvidia_available:
-                # Enable manual fan control
-                subprocess.run(['nvidia-settings', '-a', '[gpu:0]/GPUFanControlState=1'],
-                             capture_output=True, text=True)
+                # Stop following the old curve while the new one is applied
+                self._active_fan_curve = None
+                gpu_info = await self.get_gpu_info()
+                if gpu_info:
+                    speed = self._fan_speed_for_temp(fan_curve, gpu_info.temperature)
+                else:
+                    speed = max(s for _, s in fan_curve)
 
-                # Set fan curve points
-                for temp, speed in fan_curve:
-                    cmd = ['nvidia-settings', '-a', f'[fan:0]/GPUTargetFanSpeed={speed}']
-                    subprocess.run(cmd, capture_output=True, text=True)
+                # Enable manual fan control and set the target in one invocation
+                returncode, _, stderr = await self._run_command(
+                    'nvidia-settings',
+                    '-a', '[gpu:0]/GPUFanControlState=1',
+                    '-a', f'[fan:0]/GPUTargetFanSpeed={speed}'
+                )
+                if returncode != 0:
+                    self.logger.error(f"Failed to set fan curve: {stderr}")
+                    # Don't leave manual control on without a valid target
+                    await self._run_command('nvidia-settings', '-a', '[gpu:0]/GPUFanControlState=0')
+                    self._fan_target = None
+                    return False
 
+                self._fan_target = speed
+                self._active_fan_curve = fan_curve
                 self.current_settings.fan_curve = fan_curve
                 self.logger.info("Custom fan curve applied")
                 return True
@@ -256,6 +472,31 @@ class LinuxGPUController:
             self.logger.error(f"Error setting fan curve: {e}")
             return False
 
+    async def _follow_fan_curve(self, temperature: float):
+        """Update the fan target from the active curve for a new temperature"""
+        curve = self._active_fan_curve
+        if curve is None:
+            return
+
+        speed = self._fan_speed_for_temp(curve, temperature)
+        # Speed up immediately, slow down only on a clear drop so small
+        # temperature swings don't respawn nvidia-settings every reading
+        target = self._fan_target
+        if target is not None and target - FAN_CURVE_HYSTERESIS < speed <= target:
+            return
+
+        try:
+            returncode, _, stderr = await self._run_command(
+                'nvidia-settings', '-a', f'[fan:0]/GPUTargetFanSpeed={speed}'
+            )
+        except Exception as e:
+            returncode, stderr = -1, str(e)
+        if returncode != 0:
+            self.logger.error(f"Failed to update fan speed: {stderr}")
+            self._fan_target = None
+            return
+        self._fan_target = speed
+
     async def set_performance_mode(self, mode: str) -> bool:
         """Set GPU performance mode"""
         valid_modes = ['maximum', 'balanced', 'quiet']
@@ -290,12 +531,12 @@ class LinuxGPUController:
 
             settings = mode_settings[mode]
 
-            # Apply all settings
-            success = all([
-                await self.set_power_limit(settings.power_limit),
-                await self.set_clock_offsets(settings.core_offset, settings.memory_offset),
-                await self.set_fan_curve(settings.fan_curve)
-            ])
+            # Apply all settings; they touch independent endpoints
+            success = all(await asyncio.gather(
+                self.set_power_limit(settings.power_limit),
+                self.set_clock_offsets(settings.core_offset, settings.memory_offset),
+                self.set_fan_curve(settings.fan_curve)
+            ))
 
             if success:
                 self.current_settings = settings
@@ -320,20 +561,16 @@ class LinuxGPUController:
                 'threaded_optimization': 'enabled'
             }
 
-            # Apply power and clock settings
-            await self.set_power_limit(optimizations['power_limit'])
-            await self.set_clock_offsets(optimizations['core_offset'], optimizations['memory_offset'])
-
-            # Set aggressive fan curve for gaming
+            # Apply power, clock and aggressive gaming fan curve concurrently
             gaming_fan_curve = [(30, 45), (50, 65), (70, 80), (80, 90), (85, 100)]
-            await self.set_fan_curve(gaming_fan_curve)
+            await asyncio.gather(
+                self.set_power_limit(optimizations['power_limit']),
+                self.set_clock_offsets(optimizations['core_offset'], optimizations['memory_offset']),
+                self.set_fan_curve(gaming_fan_curve)
+            )
 
             # Enable GPU features via environment variables
-            os.environ.update({
-                '__GL_THREADED_OPTIMIZATIONS': '1',
-                '__GL_SHADER_CACHE': '1',
-                '__GL_ALLOW_UNOFFICIAL_PROTOCOL': '1'
-            })
+            self._apply_nvidia_env()
 
             self.logger.info("GPU optimized for gaming")
             return optimizations
@@ -354,17 +591,17 @@ class LinuxGPUController:
                 'memory_allocation': 'maximum'
             }
 
-            # Apply settings
-            await self.set_power_limit(optimizations['power_limit'])
-            await self.set_clock_offsets(optimizations['core_offset'], optimizations['memory_offset'])
-
-            # Set compute-optimized fan curve
+            # Apply settings with a compute-optimized fan curve concurrently
             ai_fan_curve = [(40, 50), (60, 70), (70, 80), (80, 90), (85, 100)]
-            await self.set_fan_curve(ai_fan_curve)
+            await asyncio.gather(
+                self.set_power_limit(optimizations['power_limit']),
+                self.set_clock_offsets(optimizations['core_offset'], optimizations['memory_offset']),
+                self.set_fan_curve(ai_fan_curve)
+            )
 
             # Set compute mode if supported
             if self.nvidia_available:
-                subprocess.run(['sudo', 'nvidia-smi', '-c', '3'], capture_output=True)
+                await self._run_command(*self._sudo, 'nvidia-smi', '-c', '3')
 
             self.logger.info("GPU optimized for AI/ML workload")
             return optimizations
@@ -398,19 +635,34 @@ class LinuxGPUController:
 
         return features
 
-    async def monitor_gpu(self, duration: int = 60) -> List[GPUInfo]:
-        """Monitor GPU for specified duration and return data points"""
-        monitoring_data = []
-        start_time = time.time()
+    async def monitor_gpu(self, duration: int = 60) -> np.ndarray:
+        """Monitor GPU for specified duration and return data points
 
-        while time.time() - start_time < duration:
+        Samples are returned as a structured array (GPU_SAMPLE_DTYPE), so
+        columns can be analysed directly, e.g. ``samples['temperature'].mean()``.
+        """
+        interval = 2.0  # 2-second monitoring interval
+        loop = asyncio.get_running_loop()
+        monitoring_data = np.zeros(math.ceil(duration / interval), dtype=GPU_SAMPLE_DTYPE)
+        count = 0
+
+        start_time = loop.time()
+        deadline = start_time
+        while loop.time() - start_time < duration:
             gpu_info = await self.get_gpu_info()
-            if gpu_info:
-                monitoring_data.append(gpu_info)
+            if gpu_info and count < len(monitoring_data):
+                monitoring_data[count] = (
+                    time.time(), gpu_info.temperature, gpu_info.power_draw,
+                    gpu_info.clock_core, gpu_info.clock_memory, gpu_info.fan_speed,
+                    gpu_info.utilization, gpu_info.memory_used
+                )
+                count += 1
 
-            await asyncio.sleep(2)  # 2-second monitoring interval
+            # Sleep to the next grid point so query time does not cause drift
+            deadline += interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
 
-        return monitoring_data
+        return monitoring_data[:count]
 
     async def apply_legion_gen9_optimizations(self) -> Dict[str, any]:
         """Apply Legion Slim 7i Gen 9 specific GPU optimizations"""
@@ -424,13 +676,6 @@ class LinuxGPUController:
                 'fan_curve': 'vapor_chamber_optimized'
             }
 
-            # Apply Gen 9 specific settings
-            await self.set_power_limit(gen9_optimizations['power_limit'])
-            await self.set_clock_offsets(
-                gen9_optimizations['core_offset'],
-                gen9_optimizations['memory_offset']
-            )
-
             # Gen 9 vapor chamber optimized fan curve
             vapor_chamber_curve = [
                 (35, 25),   # Silent below 35°C
@@ -439,14 +684,20 @@ class LinuxGPUController:
                 (80, 85),   # Aggressive cooling at high temps
                 (85, 100)   # Maximum cooling above 85°C
             ]
-            await self.set_fan_curve(vapor_chamber_curve)
+
+            # Apply Gen 9 specific settings concurrently
+            await asyncio.gather(
+                self.set_power_limit(gen9_optimizations['power_limit']),
+                self.set_clock_offsets(
+                    gen9_optimizations['core_offset'],
+                    gen9_optimizations['memory_offset']
+                ),
+                self.set_fan_curve(vapor_chamber_curve)
+            )
 
             # Legion-specific environment optimizations
-            os.environ.update({
-                '__GL_MAX_FRAMES_ALLOWED': '1',  # Reduce input lag
-                '__GL_SYNC_TO_VBLANK': '0',      # Disable VSync for gaming
-                'CUDA_CACHE_MAXSIZE': '2147483648'  # 2GB CUDA cache
-            })
+            self._apply_nvidia_env()
+            os.environ['__GL_SYNC_TO_VBLANK'] = '0'  # Disable VSync for gaming
 
             self.logger.info("Legion Gen 9 GPU optimizations applied")
             return gen9_optimizations
@@ -470,11 +721,11 @@ class LinuxGPUController:
                 performance_mode='balanced'
             )
 
-            success = all([
-                await self.set_power_limit(default_settings.power_limit),
-                await self.set_clock_offsets(default_settings.core_offset, default_settings.memory_offset),
-                await self.set_fan_curve(default_settings.fan_curve)
-            ])
+            success = all(await asyncio.gather(
+                self.set_power_limit(default_settings.power_limit),
+                self.set_clock_offsets(default_settings.core_offset, default_settings.memory_offset),
+                self.set_fan_curve(default_settings.fan_curve)
+            ))
 
             if success:
                 self.current_settings = default_settings
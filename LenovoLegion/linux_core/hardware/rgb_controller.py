@@ -10,11 +10,55 @@ import time
 import math
 import asyncio
 import colorsys
+import queue
+import threading
 from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import logging
 from pathlib import Path
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Per-zone color registers, indexed by RGBZone value
+ZONE_REGISTERS = ("rgb_color_1", "rgb_color_2", "rgb_color_3", "rgb_color_4")
+
+# Writable kernel module attributes kept open for the controller's lifetime
+SYSFS_REGISTERS = ("rgb_mode", "rgb_brightness", "rgb_speed") + ZONE_REGISTERS + ("rgb_colors_all", "rgb_apply")
+
+# Registers that set overlapping EC state; writing one invalidates the
+# cached payloads of the others
+REGISTER_ALIASES = {
+    "rgb_apply": ("rgb_mode", "rgb_brightness", "rgb_colors_all") + ZONE_REGISTERS,
+    "rgb_colors_all": ("rgb_apply",) + ZONE_REGISTERS,
+    "rgb_mode": ("rgb_apply",),
+    "rgb_brightness": ("rgb_apply",),
+    **{register: ("rgb_apply", "rgb_colors_all") for register in ZONE_REGISTERS},
+}
+
+# Space-separated channel values for every zone, as written to rgb_colors_all
+FRAME_FORMAT = b" ".join([b"%d %d %d"] * len(ZONE_REGISTERS))
+
+# Mode, brightness and a full frame, as written to rgb_apply
+APPLY_FORMAT = b"%s %d " + FRAME_FORMAT
+
+# Dimming factors in 1/256ths: 51/256 ~ 20%, 26/256 ~ 10%
+DIM_20 = 51
+DIM_10 = 26
+
+# Per-channel 10% dimming table
+DIM_LUT_10 = bytes((i * DIM_10) >> 8 for i in range(256))
+
+# Full-saturation, full-value RGB for each whole-degree hue
+HUE_LUT = tuple(
+    tuple(int(c * 255) for c in colorsys.hsv_to_rgb(h / 360, 1.0, 1.0))
+    for h in range(360)
+)
 
 class RGBMode(Enum):
     """RGB lighting modes"""
@@ -28,6 +72,23 @@ class RGBMode(Enum):
     SPECTRUM_CYCLE = "spectrum_cycle"
     CUSTOM = "custom"
 
+def _dumps(obj) -> bytes:
+    """Serialize a profile to indented JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    import json
+    return json.dumps(obj, indent=2).encode()
+
+def _loads(data: bytes):
+    """Deserialize JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+# Mode names as written to rgb_mode
+MODE_BYTES = {mode: mode.value.encode() for mode in RGBMode}
+
 class RGBZone(Enum):
     """RGB keyboard zones"""
     ZONE_1 = 0  # Left side
@@ -36,18 +97,72 @@ class RGBZone(Enum):
     ZONE_4 = 3  # Right side
     ALL_ZONES = 255
 
-@dataclass
+# Plain dict lookups for hot paths, instead of Enum value lookups
+_ZONE_BY_INDEX = {zone.value: zone for zone in RGBZone}
+_MODE_BY_VALUE = {mode.value: mode for mode in RGBMode}
+
+def _clamp_rgb(r: int, g: int, b: int) -> Tuple[int, int, int]:
+    """Clamp channel values to the 0-255 range"""
+    return max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b))
+
+def _hsv_to_rgb_u8(h: int, s: int, v: int) -> Tuple[int, int, int]:
+    """Convert 8-bit HSV to 8-bit RGB with integer math
+
+    Hue is in 1/1536ths of a turn (256 steps per sixth); saturation and
+    value are 0-255.
+    """
+    if s == 0:
+        return v, v, v
+    sector = h >> 8  # 0-5
+    f = h & 0xFF     # position within the sector
+    p = v * (255 - s) // 255
+    if sector & 1:
+        q = v * (65025 - s * f) // 65025
+        if sector == 1:
+            return q, v, p
+        if sector == 3:
+            return p, q, v
+        return v, p, q
+    t = v * (65025 - s * (255 - f)) // 65025
+    if sector == 0:
+        return v, t, p
+    if sector == 2:
+        return p, v, t
+    return t, p, v
+
+def _rgb_to_hsv_u8(r: int, g: int, b: int) -> Tuple[int, int, int]:
+    """Convert 8-bit RGB to 8-bit HSV (hue in 1/256ths of a turn) with integer math"""
+    v = max(r, g, b)
+    d = v - min(r, g, b)
+    if d == 0:
+        return 0, 0, v
+    s = 255 * d // v
+    if v == r:
+        h = 43 * (g - b) // d
+    elif v == g:
+        h = 85 + 43 * (b - r) // d
+    else:
+        h = 171 + 43 * (r - g) // d
+    return h & 0xFF, s, v
+
+@dataclass(frozen=True)
 class RGBColor:
-    """RGB color representation"""
+    """RGB color representation
+
+    Channels are not range-checked on construction. from_hex and from_hsv
+    always produce 0-255 channels; the controller's public setters clamp
+    any other color with _clamp_color before writing it.
+    """
+    __slots__ = ('red', 'green', 'blue')
+
     red: int
     green: int
     blue: int
 
-    def __post_init__(self):
-        # Ensure values are in valid range
-        self.red = max(0, min(255, self.red))
-        self.green = max(0, min(255, self.green))
-        self.blue = max(0, min(255, self.blue))
+    def __iter__(self):
+        yield self.red
+        yield self.green
+        yield self.blue
 
     def to_hex(self) -> str:
         """Convert to hex string"""
@@ -55,23 +170,44 @@ class RGBColor:
 
     def to_hsv(self) -> Tuple[float, float, float]:
         """Convert to HSV"""
-        return colorsys.rgb_to_hsv(self.red/255, self.green/255, self.blue/255)
+        h, s, v = _rgb_to_hsv_u8(self.red, self.green, self.blue)
+        return h / 256, s / 255, v / 255
 
     @classmethod
     def from_hex(cls, hex_color: str) -> 'RGBColor':
         """Create from hex string"""
-        hex_color = hex_color.lstrip('#')
-        return cls(
-            int(hex_color[0:2], 16),
-            int(hex_color[2:4], 16),
-            int(hex_color[4:6], 16)
-        )
+        # Each byte is already 0-255
+        return cls(*bytes.fromhex(hex_color.lstrip('#')[:6]))
 
     @classmethod
     def from_hsv(cls, h: float, s: float, v: float) -> 'RGBColor':
         """Create from HSV values"""
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return cls(int(r * 255), int(g * 255), int(b * 255))
+        # Hue wraps like colorsys; saturation and value are clamped
+        h6 = int(h * 1536 + 0.5) % 1536
+        s8 = max(0, min(255, int(s * 255 + 0.5)))
+        v8 = max(0, min(255, int(v * 255 + 0.5)))
+        return cls(*_hsv_to_rgb_u8(h6, s8, v8))
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray, index: int) -> 'RGBColor':
+        """Create from row index of an (N, 3) uint8 color array"""
+        r, g, b = arr[index].tolist()
+        return cls(r, g, b)
+
+def _clamp_color(color: RGBColor) -> RGBColor:
+    """Return color with every channel clamped to the 0-255 range"""
+    r, g, b = color.red, color.green, color.blue
+    if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+        return color
+    return RGBColor(*_clamp_rgb(r, g, b))
+
+def _colors_to_array(colors: List[RGBColor]) -> np.ndarray:
+    """Pack colors into an (N, 3) uint8 array"""
+    return np.array([(c.red, c.green, c.blue) for c in colors], dtype=np.uint8).reshape(-1, 3)
+
+def _dim_array(colors: np.ndarray, factor: int) -> np.ndarray:
+    """Scale a uint8 color array by factor/256"""
+    return ((colors.astype(np.uint16) * factor) >> 8).astype(np.uint8)
 
 @dataclass
 class RGBEffect:
@@ -124,16 +260,78 @@ class LinuxRGBController:
         # Animation state
         self.animation_running = False
         self.animation_task = None
+        # Set to end the running animation; created per animation so it
+        # always belongs to the running event loop
+        self._stop_event: Optional[asyncio.Event] = None
+        self._mode_dispatch = {
+            RGBMode.SPECTRUM_CYCLE: self._animate_spectrum_cycle,
+            RGBMode.RIPPLE: self._animate_ripple,
+            RGBMode.REACTIVE: self._animate_reactive,
+        }
+
+        # Last color written to each zone as a (zones, 3) uint8 array;
+        # animations update it and flush the whole frame at once
+        self._frame = np.zeros((len(ZONE_REGISTERS), 3), dtype=np.uint8)
+        # Center-bright and outer-bright ripple frames, and their
+        # formatted register writes
+        self._ripple_frames: Tuple[np.ndarray, ...] = ()
+        self._ripple_cache: Tuple[Tuple[Tuple[str, bytes], ...], ...] = ()
+        self._has_batch_write = False
+        self._has_apply = False
+
+        # Animation frames are written by a dedicated thread so slow EC
+        # writes don't stall the event loop; each queue item is one frame's
+        # (register, payload) writes
+        self._writer_q: "queue.Queue[Optional[Tuple[Tuple[str, bytes], ...]]]" = queue.Queue(maxsize=2)
+        self._writer_thread: Optional[threading.Thread] = None
+
+        # Full register paths, and cached O_WRONLY descriptors, keyed by
+        # register name
+        self._paths: Dict[str, bytes] = {
+            name: os.fsencode(f"{self.kernel_module_path}/{name}") for name in SYSFS_REGISTERS
+        }
+        self._fds: Dict[str, int] = {}
+        # Last payload successfully written to each register; repeats are
+        # skipped to avoid redundant EC traffic
+        self._last_payload: Dict[str, bytes] = {}
+        # Writes come from both the writer thread and executor threads;
+        # guards _fds and _last_payload across check, write and invalidate
+        self._io_lock = threading.Lock()
+        # Attribute names exposed by the kernel module, scanned once in
+        # initialize(); None until then, meaning every write is attempted
+        self._capabilities: Optional[frozenset] = None
+
+        # Mode and per-zone colors last set outside animations; requests
+        # that match are not written again
+        self._current_mode: Optional[RGBMode] = None
+        self._current_zone_colors: Dict[RGBZone, RGBColor] = {}
 
     async def initialize(self) -> bool:
         """Initialize RGB controller"""
         try:
+            try:
+                with os.scandir(self.kernel_module_path) as it:
+                    self._capabilities = frozenset(entry.name for entry in it)
+            except OSError:
+                self._capabilities = frozenset()
+
             # Check if kernel module supports RGB control
-            rgb_mode_path = Path(self.kernel_module_path) / "rgb_mode"
-            if not rgb_mode_path.exists():
+            if "rgb_mode" not in self._capabilities:
                 self.logger.error("RGB control not available in kernel module")
                 return False
 
+            self._open_sysfs()
+
+            # Newer kernel modules accept all four zone colors in one write
+            self._has_batch_write = "rgb_colors_all" in self._capabilities
+            # ...and mode, brightness and colors together
+            self._has_apply = "rgb_apply" in self._capabilities
+
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="rgb-writer", daemon=True)
+                self._writer_thread.start()
+
             # Initialize to a known state
             await self.set_mode(RGBMode.STATIC)
             await self.set_brightness(self.brightness)
@@ -145,13 +343,124 @@ class LinuxRGBController:
             self.logger.error(f"RGB controller initialization failed: {e}")
             return False
 
+    def _open_sysfs(self) -> None:
+        """Open every available RGB register once"""
+        with self._io_lock:
+            for register in SYSFS_REGISTERS:
+                if register in self._fds or not self._supports(register):
+                    continue
+                try:
+                    self._fds[register] = os.open(self._paths[register], os.O_WRONLY)
+                except OSError as e:
+                    self.logger.debug(f"Cannot open {register}: {e}")
+
+    def _supports(self, register: str) -> bool:
+        """Whether the kernel module exposes register"""
+        return self._capabilities is None or register in self._capabilities
+
+    def _close_sysfs(self) -> None:
+        """Close all cached register descriptors"""
+        with self._io_lock:
+            for fd in self._fds.values():
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._fds.clear()
+            # The EC may change state while nothing is open (e.g. across
+            # suspend), so start from a clean slate on reopen
+            self._last_payload.clear()
+        self._current_mode = None
+        self._current_zone_colors.clear()
+
+    def _pwrite(self, register: str, payload: bytes) -> bool:
+        """Write payload to a register through its cached descriptor
+
+        Returns False without writing if the kernel module lacks register.
+        """
+        if not self._supports(register):
+            return False
+        with self._io_lock:
+            if self._last_payload.get(register) == payload:
+                return True
+            fd = self._fds.get(register)
+            if fd is None:
+                fd = os.open(self._paths[register], os.O_WRONLY)
+                self._fds[register] = fd
+            os.pwrite(fd, payload, 0)
+            self._last_payload[register] = payload
+            for alias in REGISTER_ALIASES.get(register, ()):
+                self._last_payload.pop(alias, None)
+        return True
+
+    async def _write_register(self, register: str, payload: bytes) -> bool:
+        """Write payload to a register without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, self._pwrite, register, payload)
+
+    def _writer_loop(self) -> None:
+        """Write queued animation frames until a None sentinel arrives"""
+        while True:
+            writes = self._writer_q.get()
+            try:
+                if writes is None:
+                    return
+                for register, payload in writes:
+                    self._pwrite(register, payload)
+            except OSError as e:
+                self.logger.debug(f"Animation frame write failed: {e}")
+            finally:
+                self._writer_q.task_done()
+
+    def _submit_frame(self, writes: Tuple[Tuple[str, bytes], ...]) -> None:
+        """Queue a frame for the writer thread, dropping the oldest if full"""
+        if self._writer_thread is None:
+            for register, payload in writes:
+                self._pwrite(register, payload)
+            return
+
+        try:
+            self._writer_q.put_nowait(writes)
+        except queue.Full:
+            # Only the event loop produces frames, so a slot is free after this
+            try:
+                self._writer_q.get_nowait()
+                self._writer_q.task_done()
+            except queue.Empty:
+                pass
+            self._writer_q.put_nowait(writes)
+
+    async def _drain_writer(self) -> None:
+        """Drop pending frames and wait for an in-flight write to finish"""
+        if self._writer_thread is None:
+            return
+        while True:
+            try:
+                self._writer_q.get_nowait()
+                self._writer_q.task_done()
+            except queue.Empty:
+                break
+        await asyncio.get_running_loop().run_in_executor(None, self._writer_q.join)
+
+    async def close(self) -> None:
+        """Stop animations, the writer thread, and release register descriptors"""
+        await self.stop_animation()
+        if self._writer_thread is not None:
+            self._writer_q.put(None)
+            await asyncio.get_running_loop().run_in_executor(None, self._writer_thread.join)
+            self._writer_thread = None
+        self._close_sysfs()
+
     async def set_mode(self, mode: RGBMode) -> bool:
         """Set RGB lighting mode"""
+        if mode == self._current_mode:
+            return True
+
         try:
-            mode_path = Path(self.kernel_module_path) / "rgb_mode"
-            with open(mode_path, 'w') as f:
-                f.write(mode.value)
+            if not await self._write_register("rgb_mode", MODE_BYTES[mode]):
+                self.logger.error("RGB mode control not supported by kernel module")
+                return False
 
+            self._current_mode = mode
             self.logger.info(f"RGB mode set to: {mode.value}")
             return True
 
@@ -165,9 +474,9 @@ class LinuxRGBController:
             raise ValueError("Brightness must be between 0 and 100")
 
         try:
-            brightness_path = Path(self.kernel_module_path) / "rgb_brightness"
-            with open(brightness_path, 'w') as f:
-                f.write(str(brightness))
+            if not await self._write_register("rgb_brightness", b"%d" % brightness):
+                self.logger.error("RGB brightness control not supported by kernel module")
+                return False
 
             self.brightness = brightness
             self.logger.info(f"RGB brightness set to: {brightness}%")
@@ -179,6 +488,7 @@ class LinuxRGBController:
 
     async def set_zone_color(self, zone: RGBZone, color: RGBColor) -> bool:
         """Set color for specific zone"""
+        color = _clamp_color(color)
         try:
             # Map zone to register
             zone_registers = {
@@ -190,12 +500,24 @@ class LinuxRGBController:
 
             if zone == RGBZone.ALL_ZONES:
                 # Set all zones to the same color
-                for zone_reg in zone_registers.values():
-                    await self._write_color_register(zone_reg, color)
+                for zone_key, zone_reg in zone_registers.items():
+                    if self._current_zone_colors.get(zone_key) == color:
+                        continue
+                    if not await self._write_color_register(zone_reg, color):
+                        return False
+                    self._current_zone_colors[zone_key] = color
+                self._frame = np.tile(np.array((color.red, color.green, color.blue), dtype=np.uint8),
+                                      (len(ZONE_REGISTERS), 1))
             else:
                 zone_reg = zone_registers.get(zone)
-                if zone_reg:
-                    await self._write_color_register(zone_reg, color)
+                if zone_reg and self._current_zone_colors.get(zone) != color:
+                    if not await self._write_color_register(zone_reg, color):
+                        return False
+                    self._current_zone_colors[zone] = color
+                    # Copy rather than mutate; the frame may be a cached ripple frame
+                    frame = self._frame.copy()
+                    frame[zone.value] = (color.red, color.green, color.blue)
+                    self._frame = frame
 
             return True
 
@@ -203,18 +525,68 @@ class LinuxRGBController:
             self.logger.error(f"Failed to set zone color: {e}")
             return False
 
-    async def _write_color_register(self, register: str, color: RGBColor) -> None:
+    async def _write_color_register(self, register: str, color: RGBColor) -> bool:
         """Write color to register via kernel module"""
-        color_path = Path(self.kernel_module_path) / register
         # Write RGB values as space-separated string
-        color_value = f"{color.red} {color.green} {color.blue}"
-        with open(color_path, 'w') as f:
-            f.write(color_value)
+        return await self._write_register(register, b"%d %d %d" % (color.red, color.green, color.blue))
+
+    def _frame_writes(self, frame: np.ndarray) -> Tuple[Tuple[str, bytes], ...]:
+        """Format a (zones, 3) uint8 frame as register writes"""
+        values = frame.ravel().tolist()
+        if self._has_batch_write:
+            return (("rgb_colors_all", FRAME_FORMAT % tuple(values)),)
+        return tuple(
+            (register, b"%d %d %d" % tuple(values[i * 3:i * 3 + 3]))
+            for i, register in enumerate(ZONE_REGISTERS)
+        )
+
+    async def _write_frame_array(self, frame: np.ndarray) -> None:
+        """Write a (zones, 3) uint8 frame, in a single sysfs write when supported"""
+        self._frame = frame
+        self._submit_frame(self._frame_writes(frame))
+
+    async def _write_frame(self, zones: List[RGBZone], color: RGBColor) -> None:
+        """Set zones in the current frame to color and flush the frame"""
+        frame = self._frame.copy()
+        if RGBZone.ALL_ZONES in zones:
+            frame[:] = (color.red, color.green, color.blue)
+        else:
+            for zone in zones:
+                frame[zone.value] = (color.red, color.green, color.blue)
+        await self._write_frame_array(frame)
+
+    async def _apply_all(self, mode: RGBMode, brightness: int, colors: List[RGBColor]) -> None:
+        """Set mode, brightness and all zone colors, in one sysfs write when supported"""
+        if not 0 <= brightness <= 100:
+            raise ValueError("Brightness must be between 0 and 100")
+
+        # Zones without a color keep their current one
+        frame = self._frame.copy()
+        zone_colors = colors[:len(ZONE_REGISTERS)]
+        if zone_colors:
+            frame[:len(zone_colors)] = _colors_to_array(zone_colors)
+
+        if self._has_apply:
+            await self._write_register("rgb_apply", APPLY_FORMAT % (
+                (MODE_BYTES[mode], brightness) + tuple(frame.ravel().tolist())))
+        else:
+            await self._write_register("rgb_brightness", b"%d" % brightness)
+            await self._write_register("rgb_mode", MODE_BYTES[mode])
+            for register, payload in self._frame_writes(frame):
+                await self._write_register(register, payload)
+
+        self.brightness = brightness
+        self._frame = frame
+        self._current_mode = mode
+        self._current_zone_colors = {
+            _ZONE_BY_INDEX[i]: RGBColor.from_array(frame, i) for i in range(len(ZONE_REGISTERS))
+        }
 
     async def set_static_color(self, color: RGBColor, zones: List[RGBZone] = None) -> bool:
         """Set static color for specified zones"""
         if zones is None:
             zones = [RGBZone.ALL_ZONES]
+        color = _clamp_color(color)
 
         try:
             await self.set_mode(RGBMode.STATIC)
@@ -236,9 +608,7 @@ class LinuxRGBController:
             await self.set_zone_color(RGBZone.ALL_ZONES, color)
 
             # Set breathing speed via kernel module
-            speed_path = Path(self.kernel_module_path) / "rgb_speed"
-            with open(speed_path, 'w') as f:
-                f.write(str(speed))
+            await self._write_register("rgb_speed", b"%d" % speed)
 
             self.logger.info(f"Breathing effect started with color: {color.to_hex()}")
             return True
@@ -253,9 +623,7 @@ class LinuxRGBController:
             await self.set_mode(RGBMode.RAINBOW)
 
             # Set rainbow speed
-            speed_path = Path(self.kernel_module_path) / "rgb_speed"
-            with open(speed_path, 'w') as f:
-                f.write(str(speed))
+            await self._write_register("rgb_speed", b"%d" % speed)
 
             self.logger.info("Rainbow effect started")
             return True
@@ -271,13 +639,11 @@ class LinuxRGBController:
 
             # Set wave colors for each zone
             for i, color in enumerate(colors[:4]):  # Max 4 zones
-                zone = RGBZone(i)
+                zone = _ZONE_BY_INDEX[i]
                 await self.set_zone_color(zone, color)
 
             # Set wave speed and direction
-            speed_path = Path(self.kernel_module_path) / "rgb_speed"
-            with open(speed_path, 'w') as f:
-                f.write(str(speed))
+            await self._write_register("rgb_speed", b"%d" % speed)
 
             self.logger.info(f"Wave effect started with {len(colors)} colors")
             return True
@@ -291,10 +657,16 @@ class LinuxRGBController:
         try:
             # Stop any existing animation
             if self.animation_task:
-                self.animation_task.cancel()
+                await self.stop_animation()
+
+            effect = replace(effect, colors=[_clamp_color(c) for c in effect.colors])
+            if effect.mode == RGBMode.RIPPLE:
+                self._build_ripple_frames(effect)
+            self._current_zone_colors.clear()
 
             self.animation_running = True
-            self.animation_task = asyncio.create_task(self._run_custom_animation(effect))
+            self._stop_event = asyncio.Event()
+            self.animation_task = asyncio.create_task(self._run_custom_animation(effect, self._stop_event))
 
             self.logger.info(f"Custom animation started: {effect.mode.value}")
             return True
@@ -303,104 +675,102 @@ class LinuxRGBController:
             self.logger.error(f"Failed to start custom animation: {e}")
             return False
 
-    async def _run_custom_animation(self, effect: RGBEffect) -> None:
-        """Run custom animation loop"""
+    async def _run_custom_animation(self, effect: RGBEffect, stop: asyncio.Event) -> None:
+        """Run custom animation loop until stop is set"""
         frame = 0
-        while self.animation_running:
+        # Speed control: higher speed = shorter frame period
+        period = 0.1 + (1.0 - effect.speed / 100) * 0.5
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time() + period
+        animate = self._mode_dispatch.get(effect.mode)
+        while not stop.is_set():
             try:
-                if effect.mode == RGBMode.SPECTRUM_CYCLE:
-                    await self._animate_spectrum_cycle(frame, effect)
-                elif effect.mode == RGBMode.RIPPLE:
-                    await self._animate_ripple(frame, effect)
-                elif effect.mode == RGBMode.REACTIVE:
-                    await self._animate_reactive(frame, effect)
-
-                frame += 1
-                # Speed control: higher speed = shorter delay
-                delay = 0.1 + (1.0 - effect.speed / 100) * 0.5
-                await asyncio.sleep(delay)
-
-            except asyncio.CancelledError:
-                break
+                if animate is not None:
+                    await animate(frame, effect)
             except Exception as e:
                 self.logger.error(f"Animation error: {e}")
                 break
 
+            frame += 1
+            # Wait until a fixed deadline so render and write time don't
+            # stretch the frame period; a stop request ends the wait early
+            now = loop.time()
+            if now - next_deadline > 2 * period:
+                # Fell too far behind; skip ahead rather than burst frames
+                next_deadline = now
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=max(0.0, next_deadline - now))
+                break
+            except asyncio.TimeoutError:
+                pass
+            next_deadline += period
+
     async def _animate_spectrum_cycle(self, frame: int, effect: RGBEffect) -> None:
         """Animate spectrum cycling through all colors"""
         hue = (frame * 2) % 360  # 2 degrees per frame
-        color = RGBColor.from_hsv(hue / 360, 1.0, effect.brightness / 100)
-
-        for zone in effect.zones:
-            await self.set_zone_color(zone, color)
+        r, g, b = HUE_LUT[hue]
+        level = effect.brightness
+        color = RGBColor(r * level // 100, g * level // 100, b * level // 100)
+        await self._write_frame(effect.zones, color)
+
+    def _build_ripple_frames(self, effect: RGBEffect) -> None:
+        """Precompute both ripple frames for effect"""
+        # Bright colors for the center and outer phases, dimmed to 20%
+        bright = _colors_to_array([
+            effect.colors[0] if effect.colors else RGBColor(255, 255, 255),
+            effect.colors[1] if len(effect.colors) > 1 else RGBColor(255, 0, 0),
+        ])
+        dim = _dim_array(bright, DIM_20)
+        # Zones 1 and 4 are the outer zones, 2 and 3 the center
+        self._ripple_frames = (
+            np.stack((dim[0], bright[0], bright[0], dim[0])),
+            np.stack((bright[1], dim[1], dim[1], bright[1])),
+        )
+        self._ripple_cache = tuple(self._frame_writes(f) for f in self._ripple_frames)
 
     async def _animate_ripple(self, frame: int, effect: RGBEffect) -> None:
         """Animate ripple effect from center outward"""
-        center_zones = [RGBZone.ZONE_2, RGBZone.ZONE_3]
-        outer_zones = [RGBZone.ZONE_1, RGBZone.ZONE_4]
-
-        # Ripple timing
-        ripple_phase = (frame % 60) / 60  # 60-frame cycle
+        # 60-frame cycle: center zones bright for the first 30%, then outer zones
+        phase = 0 if frame % 60 < 18 else 1
 
-        if ripple_phase < 0.3:
-            # Center zones bright
-            bright_color = effect.colors[0] if effect.colors else RGBColor(255, 255, 255)
-            dim_color = RGBColor(
-                int(bright_color.red * 0.2),
-                int(bright_color.green * 0.2),
-                int(bright_color.blue * 0.2)
-            )
-
-            for zone in center_zones:
-                await self.set_zone_color(zone, bright_color)
-            for zone in outer_zones:
-                await self.set_zone_color(zone, dim_color)
-        else:
-            # Outer zones bright
-            bright_color = effect.colors[1] if len(effect.colors) > 1 else RGBColor(255, 0, 0)
-            dim_color = RGBColor(
-                int(bright_color.red * 0.2),
-                int(bright_color.green * 0.2),
-                int(bright_color.blue * 0.2)
-            )
-
-            for zone in outer_zones:
-                await self.set_zone_color(zone, bright_color)
-            for zone in center_zones:
-                await self.set_zone_color(zone, dim_color)
+        self._frame = self._ripple_frames[phase]
+        self._submit_frame(self._ripple_cache[phase])
 
     async def _animate_reactive(self, frame: int, effect: RGBEffect) -> None:
         """Animate reactive lighting (simulated key presses)"""
-        # Simulate random key presses for demonstration
+        # Simulate key presses for demonstration, stepping across the zones
         if frame % 30 == 0:  # Every 30 frames
-            import random
-            zone = RGBZone(random.randint(0, 3))
+            zone = _ZONE_BY_INDEX[(frame // 30) % len(ZONE_REGISTERS)]
             color = effect.colors[0] if effect.colors else RGBColor(255, 255, 255)
 
             # Flash the zone
-            await self.set_zone_color(zone, color)
+            await self._write_frame([zone], color)
             await asyncio.sleep(0.1)
 
             # Fade back to dim
             dim_color = RGBColor(
-                int(color.red * 0.1),
-                int(color.green * 0.1),
-                int(color.blue * 0.1)
+                DIM_LUT_10[color.red],
+                DIM_LUT_10[color.green],
+                DIM_LUT_10[color.blue]
             )
-            await self.set_zone_color(zone, dim_color)
+            await self._write_frame([zone], dim_color)
 
     async def stop_animation(self) -> bool:
         """Stop current animation"""
         try:
             self.animation_running = False
             if self.animation_task:
-                self.animation_task.cancel()
-                try:
-                    await self.animation_task
-                except asyncio.CancelledError:
-                    pass
+                self._stop_event.set()
+                await self.animation_task
                 self.animation_task = None
 
+            # Don't let queued frames land after whatever is written next
+            await self._drain_writer()
+
+            # Animations write zones directly, so the tracked state is stale
+            self._current_mode = None
+            self._current_zone_colors.clear()
+
             self.logger.info("Animation stopped")
             return True
 
@@ -507,24 +877,31 @@ class LinuxRGBController:
             # Stop any current animation
             await self.stop_animation()
 
-            # Set global brightness
-            await self.set_brightness(profile.global_brightness)
-
-            # Apply primary effect
-            if profile.effects:
-                primary_effect = profile.effects[0]
+            primary_effect = profile.effects[0] if profile.effects else None
 
+            if primary_effect and primary_effect.mode in (RGBMode.STATIC, RGBMode.BREATHING, RGBMode.WAVE):
+                # Mode, global brightness and zone colors in one transaction
                 if primary_effect.mode == RGBMode.STATIC:
                     color = primary_effect.colors[0] if primary_effect.colors else RGBColor(255, 255, 255)
-                    await self.set_static_color(color)
+                    colors = [color] * len(ZONE_REGISTERS)
                 elif primary_effect.mode == RGBMode.BREATHING:
                     color = primary_effect.colors[0] if primary_effect.colors else RGBColor(255, 0, 0)
-                    await self.start_breathing_effect(color, primary_effect.speed)
-                elif primary_effect.mode == RGBMode.RAINBOW:
-                    await self.start_rainbow_effect(primary_effect.speed)
-                elif primary_effect.mode == RGBMode.WAVE:
-                    await self.start_wave_effect(primary_effect.colors, primary_effect.speed)
+                    colors = [color] * len(ZONE_REGISTERS)
                 else:
+                    colors = primary_effect.colors
+
+                colors = [_clamp_color(c) for c in colors]
+                await self._apply_all(primary_effect.mode, profile.global_brightness, colors)
+                if primary_effect.mode != RGBMode.STATIC:
+                    await self._write_register("rgb_speed", b"%d" % primary_effect.speed)
+            else:
+                # Set global brightness
+                await self.set_brightness(profile.global_brightness)
+
+                # Apply primary effect
+                if primary_effect and primary_effect.mode == RGBMode.RAINBOW:
+                    await self.start_rainbow_effect(primary_effect.speed)
+                elif primary_effect:
                     await self.start_custom_animation(primary_effect)
 
             self.current_profile = profile
@@ -546,8 +923,6 @@ class LinuxRGBController:
     async def save_profile(self, profile: SpectrumProfile, filename: str) -> bool:
         """Save RGB profile to file"""
         try:
-            import json
-
             profile_data = {
                 'name': profile.name,
                 'description': profile.description,
@@ -559,7 +934,7 @@ class LinuxRGBController:
             for effect in profile.effects:
                 effect_data = {
                     'mode': effect.mode.value,
-                    'colors': [{'r': c.red, 'g': c.green, 'b': c.blue} for c in effect.colors],
+                    'colors': [list(c) for c in effect.colors],
                     'speed': effect.speed,
                     'brightness': effect.brightness,
                     'direction': effect.direction,
@@ -571,8 +946,7 @@ class LinuxRGBController:
             profiles_dir.mkdir(parents=True, exist_ok=True)
 
             profile_file = profiles_dir / f"{filename}.json"
-            with open(profile_file, 'w') as f:
-                json.dump(profile_data, f, indent=2)
+            profile_file.write_bytes(_dumps(profile_data))
 
             self.logger.info(f"RGB profile saved: {filename}")
             return True
@@ -584,8 +958,6 @@ class LinuxRGBController:
     async def load_profile(self, filename: str) -> Optional[SpectrumProfile]:
         """Load RGB profile from file"""
         try:
-            import json
-
             profiles_dir = Path.home() / '.config' / 'legion-toolkit' / 'rgb-profiles'
             profile_file = profiles_dir / f"{filename}.json"
 
@@ -593,16 +965,19 @@ class LinuxRGBController:
                 self.logger.error(f"Profile file not found: {filename}")
                 return None
 
-            with open(profile_file, 'r') as f:
-                profile_data = json.load(f)
+            profile_data = _loads(profile_file.read_bytes())
 
             effects = []
             for effect_data in profile_data['effects']:
-                colors = [RGBColor(c['r'], c['g'], c['b']) for c in effect_data['colors']]
-                zones = [RGBZone(z) for z in effect_data['zones']]
+                # Colors are [r, g, b]; older profiles stored {'r', 'g', 'b'}
+                colors = [
+                    RGBColor(*_clamp_rgb(c['r'], c['g'], c['b']) if isinstance(c, dict) else _clamp_rgb(*c))
+                    for c in effect_data['colors']
+                ]
+                zones = [_ZONE_BY_INDEX[z] for z in effect_data['zones']]
 
                 effect = RGBEffect(
-                    mode=RGBMode(effect_data['mode']),
+                    mode=_MODE_BY_VALUE[effect_data['mode']],
                     colors=colors,
                     speed=effect_data['speed'],
                     brightness=effect_data['brightness'],
@@ -631,6 +1006,7 @@ class LinuxRGBController:
         try:
             await self.stop_animation()
             await self.set_mode(RGBMode.OFF)
+            self._close_sysfs()
             self.is_enabled = False
             self.logger.info("RGB lighting turned off")
             return True
@@ -570,6 +570,29 @@ static DEVICE_ATTR_RO(gpu_temp);
 static DEVICE_ATTR_RO(gpu_hotspot);
 static DEVICE_ATTR_RO(vrm_temp);
 
+// All monitoring values in one read: cpu gpu gpu_hotspot vrm (C) fan1 fan2 (RPM)
+static ssize_t sensor_batch_show(struct device *dev,
+                                 struct device_attribute *attr, char *buf)
+{
+    static const u8 regs[] = {
+        EC_REG_CPU_PACKAGE_TEMP, EC_REG_GPU_TEMP, EC_REG_GPU_HOTSPOT,
+        EC_REG_VRM_CPU_TEMP, EC_REG_FAN1_SPEED, EC_REG_FAN2_SPEED,
+    };
+    u8 val[ARRAY_SIZE(regs)];
+    int i, ret;
+
+    for (i = 0; i < ARRAY_SIZE(regs); i++) {
+        ret = legion_ec_read(regs[i], &val[i]);
+        if (ret)
+            return ret;
+    }
+
+    return sprintf(buf, "%d %d %d %d %d %d\n", val[0], val[1], val[2], val[3],
+                   val[4] * 100, val[5] * 100);
+}
+
+static DEVICE_ATTR_RO(sensor_batch);
+
 // Power management
 static ssize_t cpu_pl1_show(struct device *dev,
                             struct device_attribute *attr, char *buf)
@@ -704,6 +727,24 @@ static ssize_t rgb_mode_show(struct device *dev,
     }
 }
 
+static int legion_parse_rgb_mode(const char *buf)
+{
+    if (sysfs_streq(buf, "off"))
+        return LEGION_RGB_OFF;
+    else if (sysfs_streq(buf, "static"))
+        return LEGION_RGB_STATIC;
+    else if (sysfs_streq(buf, "breathing"))
+        return LEGION_RGB_BREATHING;
+    else if (sysfs_streq(buf, "rainbow"))
+        return LEGION_RGB_RAINBOW;
+    else if (sysfs_streq(buf, "wave"))
+        return LEGION_RGB_WAVE;
+    else if (sysfs_streq(buf, "custom"))
+        return LEGION_RGB_CUSTOM;
+
+    return -EINVAL;
+}
+
 static ssize_t rgb_mode_store(struct device *dev,
                               struct device_attribute *attr,
                               const char *buf, size_t count)
@@ -712,20 +753,10 @@ static ssize_t rgb_mode_store(struct device *dev,
     u8 mode;
     int ret;
 
-    if (sysfs_streq(buf, "off"))
-        mode = LEGION_RGB_OFF;
-    else if (sysfs_streq(buf, "static"))
-        mode = LEGION_RGB_STATIC;
-    else if (sysfs_streq(buf, "breathing"))
-        mode = LEGION_RGB_BREATHING;
-    else if (sysfs_streq(buf, "rainbow"))
-        mode = LEGION_RGB_RAINBOW;
-    else if (sysfs_streq(buf, "wave"))
-        mode = LEGION_RGB_WAVE;
-    else if (sysfs_streq(buf, "custom"))
-        mode = LEGION_RGB_CUSTOM;
-    else
-        return -EINVAL;
+    ret = legion_parse_rgb_mode(buf);
+    if (ret < 0)
+        return ret;
+    mode = ret;
 
     ret = legion_ec_write(EC_REG_RGB_MODE, mode);
     if (ret)
@@ -769,8 +800,104 @@ static ssize_t rgb_brightness_store(struct device *dev,
     return count;
 }
 
+// Zone color registers hold one RGB332-packed byte each
+static u8 legion_pack_rgb(unsigned int r, unsigned int g, unsigned int b)
+{
+    return (r & 0xE0) | ((g >> 3) & 0x1C) | (b >> 6);
+}
+
+#define LEGION_RGB_ZONES 4
+
+// Write four zones' worth of 0-255 channel values
+static int legion_write_zone_colors(const unsigned int *c)
+{
+    static const u8 regs[LEGION_RGB_ZONES] = {
+        EC_REG_RGB_ZONE1_COLOR, EC_REG_RGB_ZONE2_COLOR,
+        EC_REG_RGB_ZONE3_COLOR, EC_REG_RGB_ZONE4_COLOR,
+    };
+    int i, ret;
+
+    for (i = 0; i < LEGION_RGB_ZONES * 3; i++) {
+        if (c[i] > 255)
+            return -EINVAL;
+    }
+
+    for (i = 0; i < LEGION_RGB_ZONES; i++) {
+        ret = legion_ec_write(regs[i],
+                              legion_pack_rgb(c[i * 3], c[i * 3 + 1], c[i * 3 + 2]));
+        if (ret)
+            return ret;
+    }
+
+    return 0;
+}
+
+// Write all four zone colors in one store: "R1 G1 B1 R2 G2 B2 R3 G3 B3 R4 G4 B4"
+static ssize_t rgb_colors_all_store(struct device *dev,
+                                    struct device_attribute *attr,
+                                    const char *buf, size_t count)
+{
+    unsigned int c[LEGION_RGB_ZONES * 3];
+    int ret;
+
+    if (sscanf(buf, "%u %u %u %u %u %u %u %u %u %u %u %u",
+               &c[0], &c[1], &c[2], &c[3], &c[4], &c[5],
+               &c[6], &c[7], &c[8], &c[9], &c[10], &c[11]) != ARRAY_SIZE(c))
+        return -EINVAL;
+
+    ret = legion_write_zone_colors(c);
+    if (ret)
+        return ret;
+
+    return count;
+}
+
+// Apply a full lighting state in one store:
+// "mode brightness R1 G1 B1 R2 G2 B2 R3 G3 B3 R4 G4 B4"
+static ssize_t rgb_apply_store(struct device *dev,
+                               struct device_attribute *attr,
+                               const char *buf, size_t count)
+{
+    struct legion_laptop *legion = dev_get_drvdata(dev);
+    char mode_name[16];
+    unsigned int brightness;
+    unsigned int c[LEGION_RGB_ZONES * 3];
+    int mode, ret;
+
+    if (sscanf(buf, "%15s %u %u %u %u %u %u %u %u %u %u %u %u %u",
+               mode_name, &brightness,
+               &c[0], &c[1], &c[2], &c[3], &c[4], &c[5],
+               &c[6], &c[7], &c[8], &c[9], &c[10], &c[11]) != ARRAY_SIZE(c) + 2)
+        return -EINVAL;
+
+    mode = legion_parse_rgb_mode(mode_name);
+    if (mode < 0)
+        return mode;
+
+    if (brightness > 100)
+        return -EINVAL;
+
+    ret = legion_write_zone_colors(c);
+    if (ret)
+        return ret;
+
+    ret = legion_ec_write(EC_REG_RGB_BRIGHTNESS, (u8)brightness);
+    if (ret)
+        return ret;
+    legion->rgb_brightness = (u8)brightness;
+
+    ret = legion_ec_write(EC_REG_RGB_MODE, (u8)mode);
+    if (ret)
+        return ret;
+    legion->rgb_mode = (u8)mode;
+
+    return count;
+}
+
 static DEVICE_ATTR_RW(rgb_mode);
 static DEVICE_ATTR_RW(rgb_brightness);
+static DEVICE_ATTR_WO(rgb_colors_all);
+static DEVICE_ATTR_WO(rgb_apply);
 
 // AI optimization control
 static ssize_t ai_optimization_show(struct device *dev,
@@ -878,6 +1005,7 @@ static struct attribute *legion_thermal_attrs[] = {
     &dev_attr_gpu_temp.attr,
     &dev_attr_gpu_hotspot.attr,
     &dev_attr_vrm_temp.attr,
+    &dev_attr_sensor_batch.attr,
     &dev_attr_fan1_speed.attr,
     &dev_attr_fan2_speed.attr,
     &dev_attr_fan1_target.attr,
@@ -888,6 +1016,8 @@ static struct attribute *legion_thermal_attrs[] = {
 static struct attribute *legion_rgb_attrs[] = {
     &dev_attr_rgb_mode.attr,
     &dev_attr_rgb_brightness.attr,
+    &dev_attr_rgb_colors_all.attr,
+    &dev_attr_rgb_apply.attr,
     NULL,
 };
 
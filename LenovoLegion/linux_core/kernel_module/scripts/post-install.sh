@@ -46,6 +46,14 @@ KERNEL=="legion_laptop_16irx9", GROUP="legion", MODE="0664"
 SUBSYSTEM=="platform", ATTRS{driver}=="legion_laptop_16irx9", GROUP="legion", MODE="0664"
 EOF
 
+# Let video group members write backlight brightness directly
+cat > /etc/udev/rules.d/90-legion-backlight.rules << 'EOF'
+# Legion Laptop Backlight Access Rules
+# Allows direct brightness writes without a sudo pipeline
+
+ACTION=="add", SUBSYSTEM=="backlight", RUN+="/bin/chgrp video /sys%p/brightness", RUN+="/bin/chmod g+w /sys%p/brightness"
+EOF
+
 # Reload udev rules
 udevadm control --reload-rules 2>/dev/null || true
 udevadm trigger 2>/dev/null || true
@@ -54,6 +54,7 @@ echo ""
 echo "Note: Configuration files have been preserved."
 echo "To completely remove all traces:"
 echo "  sudo rm -f /etc/udev/rules.d/99-legion-laptop.rules"
+echo "  sudo rm -f /etc/udev/rules.d/90-legion-backlight.rules"
 echo "  sudo rm -f /etc/modprobe.d/legion-laptop.conf"
 echo "  sudo rm -f /etc/modules-load.d/legion-laptop.conf"
 echo "  sudo groupdel legion"
@@ -12,18 +12,86 @@ Provides:
 """
 
 import os
+import re
 import json
-import yaml
+import heapq
+import atexit
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass, asdict, field
+from typing import Dict, Any, Optional, List, Tuple, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import logging
 import platform
 import getpass
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+def _dumps(obj, sort_keys: bool = False) -> bytes:
+    """Serialize to indented JSON bytes"""
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2, sort_keys=sort_keys).encode()
+
+def _loads(data: bytes):
+    """Deserialize JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+PCI_IDS_PATHS = ("/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids")
+_PCI_VENDOR_LINE = re.compile(rb"\n[0-9a-f]{4}  ")
+
+def _lookup_pci_name(vendor: str, device: str) -> str:
+    """Resolve a PCI vendor/device pair through the system pci.ids database"""
+    for path in PCI_IDS_PATHS:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+
+        start = data.find(b"\n" + vendor.encode() + b"  ")
+        if start < 0:
+            break
+        end = data.find(b"\n", start + 1)
+        vendor_name = data[start + 7:end].decode(errors="replace")
+
+        # Device rows are tab-indented under their vendor line
+        next_vendor = _PCI_VENDOR_LINE.search(data, end)
+        block = data[end:next_vendor.start() if next_vendor else len(data)]
+        match = re.search(rb"\n\t" + device.encode() + rb"  ([^\n]*)", block)
+        if match:
+            return f"{vendor_name} {match.group(1).decode(errors='replace')}"
+        return f"{vendor_name} Device {device}"
+    return f"{vendor}:{device}"
+
+def _detect_pci_display() -> str:
+    """Return the name of the first VGA or display controller on the PCI bus"""
+    for dev in sorted(Path("/sys/bus/pci/devices").iterdir()):
+        try:
+            pci_class = (dev / "class").read_text().strip()
+        except OSError:
+            continue
+        # 0x0300xx is a VGA controller, 0x0380xx any other display controller
+        if pci_class.startswith(("0x0300", "0x0380")):
+            vendor = (dev / "vendor").read_text().strip()[2:]
+            device = (dev / "device").read_text().strip()[2:]
+            return _lookup_pci_name(vendor, device)
+    return ""
+
+# Seconds to wait after the last profile change before writing the config
+SAVE_DEBOUNCE_SECONDS = 0.5
+
 class PlatformType(Enum):
     WINDOWS = "windows"
     LINUX = "linux"
@@ -41,8 +109,18 @@ class PerformanceMode(Enum):
     PERFORMANCE = "performance"
     CUSTOM = "custom"
 
+class _ConfigSection:
+    """Base for flat configuration sections"""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dictionary of the section's fields"""
+        # Only declared fields; instances can carry stray attributes
+        d = self.__dict__
+        return {name: d[name] for name in self.__dataclass_fields__}
+
+
 @dataclass
-class ThermalConfig:
+class ThermalConfig(_ConfigSection):
     """Thermal management configuration"""
     cpu_temp_target: int = 85
     gpu_temp_target: int = 83
@@ -53,7 +131,7 @@ class ThermalConfig:
     fan_speed_max: int = 100
 
 @dataclass
-class GPUConfig:
+class GPUConfig(_ConfigSection):
     """GPU configuration"""
     overclocking_enabled: bool = False
     core_clock_offset: int = 0  # MHz
@@ -63,7 +141,7 @@ class GPUConfig:
     auto_gpu_switching: bool = True
 
 @dataclass
-class RGBConfig:
+class RGBConfig(_ConfigSection):
     """RGB lighting configuration"""
     enabled: bool = True
     mode: str = "static"
@@ -73,8 +151,14 @@ class RGBConfig:
     animation_speed: int = 5
     zones_enabled: List[int] = field(default_factory=lambda: [1, 2, 3, 4])
 
+    def to_dict(self) -> Dict[str, Any]:
+        d = super().to_dict()
+        # Copy so saved profiles don't alias the live list
+        d['zones_enabled'] = list(self.zones_enabled)
+        return d
+
 @dataclass
-class AutomationConfig:
+class AutomationConfig(_ConfigSection):
     """Automation and profile switching configuration"""
     game_detection_enabled: bool = True
     auto_performance_switching: bool = True
@@ -84,7 +168,7 @@ class AutomationConfig:
     process_monitoring: bool = True
 
 @dataclass
-class UIConfig:
+class UIConfig(_ConfigSection):
     """User interface configuration"""
     theme: str = "dark"
     language: str = "en"
@@ -95,7 +179,7 @@ class UIConfig:
     update_check_enabled: bool = True
 
 @dataclass
-class HardwareConfig:
+class HardwareConfig(_ConfigSection):
     """Hardware-specific configuration"""
     platform: str = ""
     model: str = ""
@@ -130,6 +214,45 @@ class LegionConfig:
     telemetry_enabled: bool = False
     backup_settings: bool = True
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dictionary with enums as their values"""
+        return {
+            'version': self.version,
+            'platform': self.platform.value,
+            'hardware_profile': self.hardware_profile.value,
+            'performance_mode': self.performance_mode.value,
+            'thermal': self.thermal.to_dict(),
+            'gpu': self.gpu.to_dict(),
+            'rgb': self.rgb.to_dict(),
+            'automation': self.automation.to_dict(),
+            'ui': self.ui.to_dict(),
+            'hardware': self.hardware.to_dict(),
+            'profiles': dict(self.profiles),
+            'active_profile': self.active_profile,
+            'debug_mode': self.debug_mode,
+            'telemetry_enabled': self.telemetry_enabled,
+            'backup_settings': self.backup_settings,
+        }
+
+# Value lookups used when loading, cheaper than calling the enum classes
+_PLATFORM_BY_VALUE = {e.value: e for e in PlatformType}
+_HARDWARE_PROFILE_BY_VALUE = {e.value: e for e in HardwareProfile}
+_PERFORMANCE_MODE_BY_VALUE = {e.value: e for e in PerformanceMode}
+
+# Nested sections of LegionConfig with the field names each one accepts
+_SECTION_TYPES = {
+    name: (cls, frozenset(cls.__dataclass_fields__))
+    for name, cls in (
+        ('thermal', ThermalConfig),
+        ('gpu', GPUConfig),
+        ('rgb', RGBConfig),
+        ('automation', AutomationConfig),
+        ('ui', UIConfig),
+        ('hardware', HardwareConfig),
+    )
+}
+_LEGION_FIELDS = frozenset(LegionConfig.__dataclass_fields__)
+
 class ConfigManager:
     """Configuration manager with cross-platform support"""
 
@@ -145,7 +268,17 @@ class ConfigManager:
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
-        self._config: Optional[LegionConfig] = None
+        # Readers take the config from a one-element tuple that writers
+        # replace wholesale, so they never see a half-applied change
+        self._config_ref: Tuple[Optional[LegionConfig]] = (None,)
+
+        # Profile changes mark the config dirty and are written by a
+        # debounced flush(); unchanged configs are never rewritten
+        self._dirty = False
+        self._last_saved_hash: Optional[int] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        # flush() runs on the timer thread; serializes it against save()
+        self._write_lock = threading.RLock()
 
         # Load configuration
         self.load()
@@ -200,31 +333,39 @@ class ConfigManager:
                 except:
                     pass
 
-                # Check CPU
-                try:
-                    with open("/proc/cpuinfo", "r") as f:
-                        for line in f:
-                            if "model name" in line:
-                                hardware.cpu = line.split(":")[1].strip()
-                                break
-                except:
-                    pass
-
-                # Check GPU
-                import subprocess
-                try:
-                    result = subprocess.run(["lspci"], capture_output=True, text=True)
-                    for line in result.stdout.split('\n'):
-                        if 'VGA' in line or 'Display' in line:
-                            hardware.gpu = line.split(':')[-1].strip()
-                            break
-                except:
-                    pass
-
-                # Check for kernel module
+                # CPU and GPU identity only change with the machine or kernel,
+                # so they are cached per product name and kernel release
+                cache_key = f"{hardware.model}|{os.uname().release}"
+                cached = self._load_hardware_cache(cache_key)
+                if cached is not None:
+                    hardware.cpu = cached.get("cpu", "")
+                    hardware.gpu = cached.get("gpu", "")
+                else:
+                    # Check CPU
+                    try:
+                        with open("/proc/cpuinfo", "rb") as f:
+                            data = f.read()
+                        # Every logical CPU repeats the same name, the first is enough
+                        idx = data.find(b"model name")
+                        if idx >= 0:
+                            end = data.find(b"\n", idx)
+                            line = data[idx:end if end >= 0 else len(data)]
+                            hardware.cpu = line.split(b":", 1)[1].strip().decode(errors="replace")
+                    except:
+                        pass
+
+                    # Check GPU
+                    try:
+                        hardware.gpu = _detect_pci_display()
+                    except:
+                        pass
+
+                    self._save_hardware_cache(cache_key, hardware)
+
+                # Check for kernel module (always live, it can be loaded at any time)
                 try:
-                    result = subprocess.run(["lsmod"], capture_output=True, text=True)
-                    hardware.kernel_module_loaded = "legion_laptop_16irx9" in result.stdout
+                    with open("/proc/modules", "rb") as f:
+                        hardware.kernel_module_loaded = b"legion_laptop_16irx9 " in f.read()
                 except:
                     pass
 
@@ -270,12 +411,41 @@ class ConfigManager:
 
         return hardware
 
+    def _load_hardware_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return cached hardware info if it was recorded for cache_key"""
+        try:
+            with open(self.config_dir / "hardware_cache.json", "rb") as f:
+                cached = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("key") != cache_key:
+            return None
+        return cached
+
+    def _save_hardware_cache(self, cache_key: str, hardware: HardwareConfig):
+        """Persist detected hardware info for later startups"""
+        try:
+            with open(self.config_dir / "hardware_cache.json", "wb") as f:
+                f.write(_dumps({"key": cache_key, "cpu": hardware.cpu, "gpu": hardware.gpu}))
+        except OSError as e:
+            logger.debug(f"Could not write hardware cache: {e}")
+
+    @property
+    def _config(self) -> Optional[LegionConfig]:
+        return self._config_ref[0]
+
+    @_config.setter
+    def _config(self, config: Optional[LegionConfig]):
+        self._config_ref = (config,)
+
     @property
     def config(self) -> LegionConfig:
         """Get current configuration"""
-        if self._config is None:
-            self._config = self._create_default_config()
-        return self._config
+        config = self._config_ref[0]
+        if config is None:
+            config = self._create_default_config()
+            self._config_ref = (config,)
+        return config
 
     def _create_default_config(self) -> LegionConfig:
         """Create default configuration"""
@@ -311,11 +481,11 @@ class ConfigManager:
         """Load configuration from file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_dict = json.load(f)
+                config_dict = _loads(self.config_file.read_bytes())
 
                 # Convert dictionary to LegionConfig
                 self._config = self._dict_to_config(config_dict)
+                self._last_saved_hash = hash(repr(self.config.to_dict()))
                 logger.info(f"Configuration loaded from {self.config_file}")
                 return True
             else:
@@ -332,55 +502,91 @@ class ConfigManager:
 
     def save(self) -> bool:
         """Save configuration to file"""
-        try:
-            # Create backup if enabled
-            if self.config.backup_settings and self.config_file.exists():
-                self._create_backup()
+        with self._write_lock:
+            self._cancel_flush()
+            try:
+                config_dict = self.config.to_dict()
+                return self._write(config_dict)
+
+            except Exception as e:
+                logger.error(f"Failed to save configuration: {e}")
+                return False
 
-            # Convert config to dictionary
-            config_dict = asdict(self.config)
+    def _write(self, config_dict: Dict[str, Any]) -> bool:
+        """Write a configuration dictionary to the config file"""
+        with self._write_lock:
+            try:
+                # Create backup if enabled
+                if self.config.backup_settings and self.config_file.exists():
+                    self._create_backup()
+
+                # Write to a temp file and rename so a crash never leaves a torn file
+                tmp_file = self.config_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dumps(config_dict, sort_keys=True))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.config_file)
+
+                self._dirty = False
+                self._last_saved_hash = hash(repr(config_dict))
+                logger.info(f"Configuration saved to {self.config_file}")
+                return True
 
-            # Convert enums to strings
-            config_dict['platform'] = self.config.platform.value
-            config_dict['hardware_profile'] = self.config.hardware_profile.value
-            config_dict['performance_mode'] = self.config.performance_mode.value
+            except Exception as e:
+                logger.error(f"Failed to save configuration: {e}")
+                return False
 
-            # Save to file with proper formatting
-            with open(self.config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2, sort_keys=True)
+    def _mark_dirty(self):
+        """Schedule a debounced flush; repeated changes coalesce into one write"""
+        with self._write_lock:
+            self._dirty = True
+            self._cancel_flush()
+            self._flush_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _cancel_flush(self):
+        """Cancel a pending debounced flush"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def flush(self) -> bool:
+        """Write pending changes, skipping the write if nothing changed on disk"""
+        with self._write_lock:
+            self._cancel_flush()
+            if not self._dirty:
+                return True
 
-            logger.info(f"Configuration saved to {self.config_file}")
-            return True
+            try:
+                config_dict = self.config.to_dict()
+                if hash(repr(config_dict)) == self._last_saved_hash:
+                    self._dirty = False
+                    return True
+                return self._write(config_dict)
 
-        except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
-            return False
+            except Exception as e:
+                logger.error(f"Failed to save configuration: {e}")
+                return False
 
     def _dict_to_config(self, config_dict: Dict) -> LegionConfig:
         """Convert dictionary to LegionConfig object"""
         # Handle enum conversions
         if 'platform' in config_dict:
-            config_dict['platform'] = PlatformType(config_dict['platform'])
+            config_dict['platform'] = _PLATFORM_BY_VALUE[config_dict['platform']]
         if 'hardware_profile' in config_dict:
-            config_dict['hardware_profile'] = HardwareProfile(config_dict['hardware_profile'])
+            config_dict['hardware_profile'] = _HARDWARE_PROFILE_BY_VALUE[config_dict['hardware_profile']]
         if 'performance_mode' in config_dict:
-            config_dict['performance_mode'] = PerformanceMode(config_dict['performance_mode'])
-
-        # Create nested dataclass objects
-        if 'thermal' in config_dict:
-            config_dict['thermal'] = ThermalConfig(**config_dict['thermal'])
-        if 'gpu' in config_dict:
-            config_dict['gpu'] = GPUConfig(**config_dict['gpu'])
-        if 'rgb' in config_dict:
-            config_dict['rgb'] = RGBConfig(**config_dict['rgb'])
-        if 'automation' in config_dict:
-            config_dict['automation'] = AutomationConfig(**config_dict['automation'])
-        if 'ui' in config_dict:
-            config_dict['ui'] = UIConfig(**config_dict['ui'])
-        if 'hardware' in config_dict:
-            config_dict['hardware'] = HardwareConfig(**config_dict['hardware'])
-
-        return LegionConfig(**config_dict)
+            config_dict['performance_mode'] = _PERFORMANCE_MODE_BY_VALUE[config_dict['performance_mode']]
+
+        # Create nested dataclass objects, ignoring fields this version does not know
+        for key, (section_cls, known) in _SECTION_TYPES.items():
+            if key in config_dict:
+                values = config_dict[key]
+                config_dict[key] = section_cls(**{k: v for k, v in values.items() if k in known})
+
+        return LegionConfig(**{k: v for k, v in config_dict.items() if k in _LEGION_FIELDS})
 
     def _create_backup(self):
         """Create configuration backup"""
@@ -393,10 +599,13 @@ class ConfigManager:
         try:
             shutil.copy2(self.config_file, backup_file)
 
-            # Keep only last 10 backups
-            backups = sorted(self.backup_dir.glob("config_backup_*.json"))
-            for old_backup in backups[:-10]:
-                old_backup.unlink()
+            # Keep only last 10 backups; names embed a sortable timestamp
+            with os.scandir(self.backup_dir) as it:
+                backups = [e.name for e in it
+                           if e.name.startswith("config_backup_") and e.name.endswith(".json")]
+            if len(backups) > 10:
+                for name in heapq.nsmallest(len(backups) - 10, backups):
+                    os.unlink(self.backup_dir / name)
 
         except Exception as e:
             logger.warning(f"Failed to create backup: {e}")
@@ -407,18 +616,23 @@ class ConfigManager:
 
     def save_profile(self, name: str, description: str = "") -> bool:
         """Save current settings as a profile"""
+        from datetime import datetime
+
         try:
+            config = self.config
             profile = {
                 "description": description,
                 "created": str(datetime.now()),
-                "performance_mode": self.config.performance_mode.value,
-                "thermal": asdict(self.config.thermal),
-                "gpu": asdict(self.config.gpu),
-                "rgb": asdict(self.config.rgb)
+                "performance_mode": config.performance_mode.value,
+                "thermal": config.thermal.to_dict(),
+                "gpu": config.gpu.to_dict(),
+                "rgb": config.rgb.to_dict()
             }
 
-            self.config.profiles[name] = profile
-            self.save()
+            profiles = dict(config.profiles)
+            profiles[name] = profile
+            self._config = replace(config, profiles=profiles)
+            self._mark_dirty()
             logger.info(f"Profile '{name}' saved")
             return True
 
@@ -433,20 +647,21 @@ class ConfigManager:
                 logger.error(f"Profile '{name}' not found")
                 return False
 
-            profile = self.config.profiles[name]
+            config = self.config
+            profile = config.profiles[name]
 
-            # Apply profile settings
+            # Build the profile's settings into a new config, then swap it in
+            changes: Dict[str, Any] = {'active_profile': name}
             if 'performance_mode' in profile:
-                self.config.performance_mode = PerformanceMode(profile['performance_mode'])
-            if 'thermal' in profile:
-                self.config.thermal = ThermalConfig(**profile['thermal'])
-            if 'gpu' in profile:
-                self.config.gpu = GPUConfig(**profile['gpu'])
-            if 'rgb' in profile:
-                self.config.rgb = RGBConfig(**profile['rgb'])
-
-            self.config.active_profile = name
-            self.save()
+                changes['performance_mode'] = _PERFORMANCE_MODE_BY_VALUE[profile['performance_mode']]
+            # Profiles saved by other versions may carry unknown fields
+            for key in ('thermal', 'gpu', 'rgb'):
+                if key in profile:
+                    section_cls, known = _SECTION_TYPES[key]
+                    changes[key] = section_cls(**{k: v for k, v in profile[key].items() if k in known})
+
+            self._config = replace(config, profiles=dict(config.profiles), **changes)
+            self._mark_dirty()
             logger.info(f"Profile '{name}' loaded")
             return True
 
@@ -457,11 +672,12 @@ class ConfigManager:
     def delete_profile(self, name: str) -> bool:
         """Delete a profile"""
         try:
-            if name in self.config.profiles:
-                del self.config.profiles[name]
-                if self.config.active_profile == name:
-                    self.config.active_profile = "default"
-                self.save()
+            config = self.config
+            if name in config.profiles:
+                profiles = {k: v for k, v in config.profiles.items() if k != name}
+                active_profile = "default" if config.active_profile == name else config.active_profile
+                self._config = replace(config, profiles=profiles, active_profile=active_profile)
+                self._mark_dirty()
                 logger.info(f"Profile '{name}' deleted")
                 return True
             else:
@@ -479,15 +695,10 @@ class ConfigManager:
     def export_config(self, export_path: Path) -> bool:
         """Export configuration to file"""
         try:
-            config_dict = asdict(self.config)
-
-            # Convert enums
-            config_dict['platform'] = self.config.platform.value
-            config_dict['hardware_profile'] = self.config.hardware_profile.value
-            config_dict['performance_mode'] = self.config.performance_mode.value
+            config_dict = self.config.to_dict()
 
-            with open(export_path, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            with open(export_path, 'wb') as f:
+                f.write(_dumps(config_dict))
 
             logger.info(f"Configuration exported to {export_path}")
             return True
@@ -499,8 +710,8 @@ class ConfigManager:
     def import_config(self, import_path: Path) -> bool:
         """Import configuration from file"""
         try:
-            with open(import_path, 'r') as f:
-                config_dict = json.load(f)
+            with open(import_path, 'rb') as f:
+                config_dict = _loads(f.read())
 
             # Validate and merge with current config
             imported_config = self._dict_to_config(config_dict)
@@ -563,6 +774,8 @@ def get_config_manager() -> ConfigManager:
     global _config_manager
     if _config_manager is None:
         _config_manager = ConfigManager()
+        # Don't lose debounced profile changes on exit
+        atexit.register(_config_manager.flush)
     return _config_manager
 
 def get_config() -> LegionConfig:
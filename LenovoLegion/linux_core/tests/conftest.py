@@ -25,8 +25,11 @@ def mock_hardware():
         "ec_support": True
     }
 
+    # A real HardwareConfig so the config can be serialized
+    from legion_toolkit.config import HardwareConfig
+
     with patch('legion_toolkit.config.ConfigManager._detect_hardware') as mock_detect:
-        mock_detect.return_value = Mock(**hardware_info)
+        mock_detect.return_value = HardwareConfig(**hardware_info)
         yield hardware_info
 
 @pytest.fixture
@@ -8,6 +8,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, Mock
 
+from legion_toolkit import config as config_module
 from legion_toolkit.config import (
     ConfigManager, LegionConfig, ThermalConfig, GPUConfig,
     PlatformType, HardwareProfile, PerformanceMode
@@ -88,6 +89,49 @@ class TestConfigManager:
         # Try to delete non-existent profile
         assert config_manager.delete_profile("non_existent") is False
 
+    def test_profile_saves_are_debounced(self, temp_config_dir, mock_hardware):
+        """Test repeated profile changes produce a single write on flush"""
+        config_manager = ConfigManager(temp_config_dir)
+
+        with patch.object(config_manager, '_write', wraps=config_manager._write) as mock_write:
+            for i in range(5):
+                config_manager.config.thermal.cpu_temp_target = 80 + i
+                config_manager.save_profile(f"profile_{i}", "Test profile")
+            assert mock_write.call_count == 0
+
+            assert config_manager.flush() is True
+            assert mock_write.call_count == 1
+
+            # Nothing changed since, so a second flush does not write
+            assert config_manager.flush() is True
+            assert mock_write.call_count == 1
+
+        saved = json.loads(config_manager.config_file.read_text())
+        assert sorted(saved["profiles"]) == [f"profile_{i}" for i in range(5)]
+        assert not config_manager.config_file.with_suffix('.json.tmp').exists()
+
+    def test_unknown_fields_are_ignored(self, temp_config_dir, mock_hardware):
+        """Test configs and profiles from other versions load without their unknown fields"""
+        config_manager = ConfigManager(temp_config_dir)
+        config_manager.save_profile("test", "Test profile")
+        config_manager.flush()
+
+        config_dict = json.loads(config_manager.config_file.read_text())
+        config_dict["removed_option"] = True
+        config_dict["thermal"]["cpu_temp_target"] = 91
+        config_dict["thermal"]["future_option"] = 1
+        config_dict["profiles"]["test"]["gpu"]["future_option"] = 2
+        config_dict["profiles"]["test"]["gpu"]["power_limit"] = 120
+        config_manager.config_file.write_text(json.dumps(config_dict))
+
+        new_config_manager = ConfigManager(temp_config_dir)
+        assert new_config_manager.config.thermal.cpu_temp_target == 91
+        assert not hasattr(new_config_manager.config, "removed_option")
+        assert not hasattr(new_config_manager.config.thermal, "future_option")
+
+        assert new_config_manager.load_profile("test") is True
+        assert new_config_manager.config.gpu.power_limit == 120
+
     def test_config_export_import(self, temp_config_dir, mock_hardware):
         """Test configuration export and import"""
         config_manager = ConfigManager(temp_config_dir)
@@ -280,5 +324,49 @@ class TestGPUConfig:
         assert -1000 <= gpu.memory_clock_offset <= 1000
 
 
+
+class TestPciIdsLookup:
+    """Test GPU name resolution through pci.ids"""
+
+    PCI_IDS = (
+        "# pci.ids fixture\n"
+        "#\n"
+        "1002  Advanced Micro Devices, Inc. [AMD/ATI]\n"
+        "\t15bf  Phoenix1\n"
+        "10de  NVIDIA Corporation\n"
+        "\t0020  NV4 [Riva TNT]\n"
+        "\t2820  AD106M [GeForce RTX 4070 Max-Q / Mobile]\n"
+        "\t\t17aa 3d3c  Legion Slim 7i\n"
+        "10df  Emulex Corporation\n"
+        "\t2860  Not an NVIDIA device\n"
+    )
+
+    @pytest.fixture
+    def pci_ids(self, tmp_path, monkeypatch):
+        path = tmp_path / "pci.ids"
+        path.write_text(self.PCI_IDS)
+        monkeypatch.setattr(config_module, "PCI_IDS_PATHS", (str(tmp_path / "missing.ids"), str(path)))
+        return path
+
+    def test_known_vendor_and_device(self, pci_ids):
+        """Test a listed device resolves to vendor and device names"""
+        assert config_module._lookup_pci_name("10de", "2820") == \
+            "NVIDIA Corporation AD106M [GeForce RTX 4070 Max-Q / Mobile]"
+        assert config_module._lookup_pci_name("1002", "15bf") == \
+            "Advanced Micro Devices, Inc. [AMD/ATI] Phoenix1"
+
+    def test_known_vendor_unknown_device(self, pci_ids):
+        """Test an unlisted device does not match the next vendor's entries"""
+        assert config_module._lookup_pci_name("10de", "2860") == "NVIDIA Corporation Device 2860"
+
+    def test_unknown_vendor(self, pci_ids):
+        """Test an unlisted vendor falls back to the raw IDs"""
+        assert config_module._lookup_pci_name("8086", "a788") == "8086:a788"
+
+    def test_missing_database(self, tmp_path, monkeypatch):
+        """Test raw IDs are returned when no pci.ids is installed"""
+        monkeypatch.setattr(config_module, "PCI_IDS_PATHS", (str(tmp_path / "missing.ids"),))
+        assert config_module._lookup_pci_name("10de", "2820") == "10de:2820"
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -97,6 +97,39 @@ class TestGPUController:
             gpu = LinuxGPUController()
             assert gpu is not None
 
+    def test_fan_curve_follows_temperature(self):
+        """Test a fan curve applied at idle speeds up once the GPU heats up"""
+        import asyncio
+        from hardware.gpu_controller import LinuxGPUController, GPUInfo
+
+        with patch.object(LinuxGPUController, '_check_nvidia_support', return_value=True):
+            gpu = LinuxGPUController()
+
+        temperature = [35.0]
+        gpu._nvml_handle = object()
+        gpu.info_ttl = 0
+        gpu._get_nvml_info = lambda: GPUInfo(
+            name="NVIDIA GeForce RTX 4070 Laptop GPU", driver_version="535.86.05",
+            memory_total=8192, memory_used=0, temperature=temperature[0], power_draw=0.0,
+            clock_core=0, clock_memory=0, fan_speed=0, utilization=0.0
+        )
+        commands = []
+
+        async def run_command(*args, **kwargs):
+            commands.append(args)
+            return 0, "", ""
+        gpu._run_command = run_command
+
+        async def scenario():
+            assert await gpu.set_fan_curve([(40, 30), (60, 50), (80, 85), (90, 100)]) is True
+            temperature[0] = 88.0
+            await gpu.get_gpu_info()
+
+        asyncio.run(scenario())
+
+        assert commands[0][-1] == '[fan:0]/GPUTargetFanSpeed=30'
+        assert commands[-1][-1] == '[fan:0]/GPUTargetFanSpeed=97'
+
     @pytest.mark.gpu
     def test_gpu_info_retrieval(self, mock_gpu_controller):
         """Test GPU information retrieval"""
@@ -242,6 +275,71 @@ class TestRGBController:
             result = mock_rgb_controller.set_zone_color(zone, color)
             assert result is True
 
+    def test_rgb_setters_clamp_out_of_range_colors(self, tmp_path):
+        """Test out-of-range channels are clamped before reaching sysfs"""
+        import asyncio
+        import os
+        from hardware.rgb_controller import LinuxRGBController, RGBColor, RGBZone
+
+        for name in ("rgb_mode", "rgb_brightness", "rgb_color_1", "rgb_color_2",
+                     "rgb_color_3", "rgb_color_4"):
+            (tmp_path / name).write_text("")
+
+        rgb = LinuxRGBController()
+        rgb._paths = {name: os.fsencode(str(tmp_path / name)) for name in rgb._paths}
+
+        async def scenario():
+            assert await rgb.set_zone_color(RGBZone.ZONE_1, RGBColor(300, -5, 128)) is True
+            assert await rgb.set_static_color(RGBColor(0, 999, 0), [RGBZone.ZONE_2]) is True
+            await rgb.close()
+
+        asyncio.run(scenario())
+
+        assert (tmp_path / "rgb_color_1").read_text() == "255 0 128"
+        assert (tmp_path / "rgb_color_2").read_text() == "0 255 0"
+
+    def test_rgb_color_from_hsv_matches_colorsys(self):
+        """Test integer HSV conversion stays within two levels of colorsys"""
+        import colorsys
+        from hardware.rgb_controller import RGBColor
+
+        for hue in range(0, 361, 3):
+            for s in (0, 0.25, 0.5, 0.75, 1.0):
+                for v in (0, 0.3, 0.6, 1.0):
+                    expected = [int(c * 255) for c in colorsys.hsv_to_rgb(hue / 360, s, v)]
+                    color = RGBColor.from_hsv(hue / 360, s, v)
+                    for got, want in zip(color, expected):
+                        assert abs(got - want) <= 2, (hue, s, v, tuple(color), expected)
+
+
+class TestDisplayManager:
+    """Test display manager settings persistence"""
+
+    def test_setter_saves_are_coalesced(self, tmp_path):
+        """Test back-to-back setter calls produce a single settings write"""
+        import asyncio
+        import json
+        import os
+        from features import display_manager
+        from features.display_manager import DisplayManager
+
+        manager = DisplayManager()
+        manager.config_file = tmp_path / "display.json"
+
+        async def write_kernel_param(param, value):
+            return True
+        manager._write_kernel_param = write_kernel_param
+
+        async def scenario():
+            assert await manager.set_overdrive_level(1) is True
+            assert await manager.set_overdrive_level(2) is True
+            await manager.flush_settings()
+
+        with patch.object(display_manager.os, 'replace', wraps=os.replace) as mock_replace:
+            asyncio.run(scenario())
+
+        assert mock_replace.call_count == 1
+        assert json.loads(manager.config_file.read_text())['overdrive_level'] == 2
 
 class TestThermalController:
     """Test thermal management functionality"""